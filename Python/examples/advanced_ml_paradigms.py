@@ -7,18 +7,147 @@ This script demonstrates:
 3. Federated learning experiments
 """
 
+import os
 import sys
-sys.path.insert(0, 'Python')
 
-from seedhash import SeedExperimentManager, MLMetrics
-import random
+try:
+    from seedhash import SeedExperimentManager, MLMetrics
+except ImportError:
+    # Not installed: fall back to the in-repo package (run from repo root)
+    sys.path.insert(0, 'Python')
+    from seedhash import SeedExperimentManager, MLMetrics
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def example_semi_supervised_learning():
-    """Example 1: Semi-Supervised Learning Experiments."""
-    print("=" * 70)
+# Banner strings shared by every example's output
+BANNER = "=" * 70
+RULE = "-" * 70
+
+# Per-seed progress lines; set SEEDHASH_VERBOSE=0 to print only the summaries
+VERBOSE = os.environ.get("SEEDHASH_VERBOSE", "1") == "1"
+
+# Worker processes for the per-seed trials; set SEEDHASH_WORKERS=0 for one per
+# CPU or N > 1 for a pool of N. The default runs trials serially in-process.
+MAX_WORKERS = int(os.environ.get("SEEDHASH_WORKERS", "1")) or None
+
+
+def _report(lines):
+    """Write one trial's progress lines with a single stdout call."""
+    if VERBOSE:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _map_trials(trial_func, seeds, max_workers=1):
+    """Run independent per-seed trials, preserving seed order.
+    
+    Trials run serially in-process by default; the example trials take well
+    under a millisecond, less than a worker process costs to start. Pass
+    max_workers > 1 (or None for one per CPU) to use a process pool for
+    heavier trials. Each trial builds its own generator from its seed, so
+    results are the same for any number of workers.
+    """
+    if max_workers == 1:
+        return [trial_func(seed) for seed in seeds]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(trial_func, seeds))
+
+
+def _run_ssl_trial(seed):
+    """Simulate one semi-supervised run and return its metrics."""
+    rng = np.random.default_rng(seed)
+    
+    # Simulate labeled data (10% of dataset)
+    n_labeled = 100
+    n_unlabeled = 900
+    
+    # Labeled data predictions (~15% replaced by a random class)
+    y_labeled_true = rng.integers(0, 3, n_labeled)
+    flip_mask = rng.random(n_labeled) < 0.15
+    y_labeled_pred = np.where(flip_mask, rng.integers(0, 3, n_labeled), y_labeled_true)
+    
+    # Pseudo-labels for unlabeled data
+    y_unlabeled_pseudo = rng.integers(0, 3, n_unlabeled)
+    pseudo_confidence = rng.uniform(0.6, 0.99, n_unlabeled)
+    consistency_scores = rng.uniform(0.7, 0.95, n_unlabeled)
+    
+    # Calculate semi-supervised metrics
+    return MLMetrics.semi_supervised_metrics(
+        y_labeled_true,
+        y_labeled_pred,
+        y_unlabeled_pseudo,
+        pseudo_confidence,
+        consistency_scores
+    )
+
+
+def _run_rl_trial(seed, n_episodes=100):
+    """Simulate one RL training run and return its metrics."""
+    rng = np.random.default_rng(seed)
+    
+    # One draw for reward noise, episode lengths and Q-values
+    u_noise, u_length, u_q = rng.random((3, n_episodes))
+    
+    # Simulate episode rewards (improving over episodes)
+    base_rewards = 50 + (np.arange(n_episodes) / n_episodes) * 150
+    episode_rewards = np.maximum(10, base_rewards + (u_noise * 60 - 30))
+    episode_lengths = (50 + u_length * 150).astype(int)
+    success_flags = episode_rewards > 195  # CartPole success threshold
+    q_values = 10 + u_q * (episode_rewards - 10)
+    
+    # Calculate RL metrics
+    return MLMetrics.reinforcement_learning_metrics(
+        episode_rewards,
+        episode_lengths,
+        success_flags,
+        q_values
+    )
+
+
+def _run_fl_trial(seed, n_clients=10, communication_rounds=50):
+    """Simulate one federated training run and return its metrics."""
+    rng = np.random.default_rng(seed)
+    
+    # One draw for all per-client quantities, scaled to their ranges below
+    u_acc, u_loss, u_div, u_part = rng.random((4, n_clients))
+    
+    # Client accuracies (heterogeneous)
+    base_accuracy = 0.85
+    client_accuracies = np.clip(
+        base_accuracy + (u_acc * 0.3 - 0.15), 0.5, 0.99
+    )
+    
+    # Client losses
+    client_losses = (1.0 - client_accuracies) * (0.8 + u_loss * 0.4)
+    
+    # Model divergences (how far client models drift from global)
+    model_divergences = 0.01 + u_div * 0.09
+    
+    # Participation rates
+    participation_rates = 0.7 + u_part * 0.3
+    
+    # Calculate federated learning metrics
+    return MLMetrics.federated_learning_metrics(
+        client_accuracies,
+        communication_rounds,
+        client_losses,
+        model_divergences,
+        participation_rates
+    )
+
+
+def example_semi_supervised_learning(max_workers=1):
+    """Example 1: Semi-Supervised Learning Experiments.
+    
+    Args:
+        max_workers: Worker processes for the trials (see _map_trials).
+    """
+    print(BANNER)
     print("Example 1: Semi-Supervised Learning")
-    print("=" * 70)
+    print(BANNER)
     
     manager = SeedExperimentManager("semi_supervised_study")
     
@@ -39,34 +168,8 @@ def example_semi_supervised_learning():
     print("Running semi-supervised learning experiments...")
     print("(Simulating label propagation with 10% labeled data)\n")
     
-    for i, seed in enumerate(hierarchy[2][:8]):
-        random.seed(seed)
-        
-        # Simulate labeled data (10% of dataset)
-        n_labeled = 100
-        n_unlabeled = 900
-        
-        # Labeled data predictions
-        y_labeled_true = [random.randint(0, 2) for _ in range(n_labeled)]
-        y_labeled_pred = [
-            val if random.random() > 0.15 else random.randint(0, 2) 
-            for val in y_labeled_true
-        ]
-        
-        # Pseudo-labels for unlabeled data
-        y_unlabeled_pseudo = [random.randint(0, 2) for _ in range(n_unlabeled)]
-        pseudo_confidence = [random.uniform(0.6, 0.99) for _ in range(n_unlabeled)]
-        consistency_scores = [random.uniform(0.7, 0.95) for _ in range(n_unlabeled)]
-        
-        # Calculate semi-supervised metrics
-        metrics = MLMetrics.semi_supervised_metrics(
-            y_labeled_true,
-            y_labeled_pred,
-            y_unlabeled_pseudo,
-            pseudo_confidence,
-            consistency_scores
-        )
-        
+    seeds = hierarchy[2][:8]
+    for seed, metrics in zip(seeds, _map_trials(_run_ssl_trial, seeds, max_workers)):
         # Track experiment
         manager.add_experiment_result(
             seed=seed,
@@ -80,11 +183,13 @@ def example_semi_supervised_learning():
             }
         )
         
-        print(f"  Seed {seed}:")
-        print(f"    Labeled accuracy: {metrics['labeled_accuracy']:.3f}")
-        print(f"    Pseudo confidence: {metrics['avg_pseudo_confidence']:.3f}")
-        print(f"    Consistency: {metrics['avg_consistency']:.3f}")
-        print(f"    Label ratio: {metrics['label_ratio']:.1%}")
+        _report([
+            f"  Seed {seed}:",
+            f"    Labeled accuracy: {metrics['labeled_accuracy']:.3f}",
+            f"    Pseudo confidence: {metrics['avg_pseudo_confidence']:.3f}",
+            f"    Consistency: {metrics['avg_consistency']:.3f}",
+            f"    Label ratio: {metrics['label_ratio']:.1%}"
+        ])
     
     # Get results
     df = manager.get_results_dataframe()
@@ -95,11 +200,15 @@ def example_semi_supervised_learning():
     return manager
 
 
-def example_reinforcement_learning():
-    """Example 2: Reinforcement Learning Experiments."""
-    print("=" * 70)
+def example_reinforcement_learning(max_workers=1):
+    """Example 2: Reinforcement Learning Experiments.
+    
+    Args:
+        max_workers: Worker processes for the trials (see _map_trials).
+    """
+    print(BANNER)
     print("Example 2: Reinforcement Learning")
-    print("=" * 70)
+    print(BANNER)
     
     manager = SeedExperimentManager("rl_cartpole_study")
     
@@ -120,35 +229,9 @@ def example_reinforcement_learning():
     print("Running RL training experiments...")
     print("(Simulating CartPole environment)\n")
     
-    for i, seed in enumerate(hierarchy[2][:10]):
-        random.seed(seed)
-        
-        # Simulate episode rewards (improving over episodes)
-        n_episodes = 100
-        episode_rewards = []
-        episode_lengths = []
-        success_flags = []
-        q_values = []
-        
-        for ep in range(n_episodes):
-            # Simulate learning progress
-            base_reward = 50 + (ep / n_episodes) * 150
-            noise = random.uniform(-30, 30)
-            reward = max(10, base_reward + noise)
-            
-            episode_rewards.append(reward)
-            episode_lengths.append(int(random.uniform(50, 200)))
-            success_flags.append(reward > 195)  # CartPole success threshold
-            q_values.append(random.uniform(10, reward))
-        
-        # Calculate RL metrics
-        metrics = MLMetrics.reinforcement_learning_metrics(
-            episode_rewards,
-            episode_lengths,
-            success_flags,
-            q_values
-        )
-        
+    n_episodes = 100
+    seeds = hierarchy[2][:10]
+    for seed, metrics in zip(seeds, _map_trials(_run_rl_trial, seeds, max_workers)):
         # Track experiment
         manager.add_experiment_result(
             seed=seed,
@@ -163,11 +246,13 @@ def example_reinforcement_learning():
             }
         )
         
-        print(f"  Seed {seed}:")
-        print(f"    Mean reward: {metrics['mean_reward']:.1f}")
-        print(f"    Success rate: {metrics['success_rate']:.1%}")
-        print(f"    Episode length: {metrics['mean_episode_length']:.1f}")
-        print(f"    Improvement rate: {metrics.get('improvement_rate', 0):.2%}")
+        _report([
+            f"  Seed {seed}:",
+            f"    Mean reward: {metrics['mean_reward']:.1f}",
+            f"    Success rate: {metrics['success_rate']:.1%}",
+            f"    Episode length: {metrics['mean_episode_length']:.1f}",
+            f"    Improvement rate: {metrics.get('improvement_rate', 0):.2%}"
+        ])
     
     # Get results
     df = manager.get_results_dataframe()
@@ -179,11 +264,15 @@ def example_reinforcement_learning():
     return manager
 
 
-def example_federated_learning():
-    """Example 3: Federated Learning Experiments."""
-    print("=" * 70)
+def example_federated_learning(max_workers=1):
+    """Example 3: Federated Learning Experiments.
+    
+    Args:
+        max_workers: Worker processes for the trials (see _map_trials).
+    """
+    print(BANNER)
     print("Example 3: Federated Learning")
-    print("=" * 70)
+    print(BANNER)
     
     manager = SeedExperimentManager("federated_mnist_study")
     
@@ -204,41 +293,9 @@ def example_federated_learning():
     print("Running federated learning experiments...")
     print("(Simulating 10 clients with IID data)\n")
     
-    for i, seed in enumerate(hierarchy[2][:8]):
-        random.seed(seed)
-        
-        # Simulate federated learning setup
-        n_clients = 10
-        communication_rounds = 50
-        
-        # Client accuracies (heterogeneous)
-        base_accuracy = 0.85
-        client_accuracies = [
-            max(0.5, min(0.99, base_accuracy + random.uniform(-0.15, 0.15)))
-            for _ in range(n_clients)
-        ]
-        
-        # Client losses
-        client_losses = [
-            (1.0 - acc) * random.uniform(0.8, 1.2)
-            for acc in client_accuracies
-        ]
-        
-        # Model divergences (how far client models drift from global)
-        model_divergences = [random.uniform(0.01, 0.1) for _ in range(n_clients)]
-        
-        # Participation rates
-        participation_rates = [random.uniform(0.7, 1.0) for _ in range(n_clients)]
-        
-        # Calculate federated learning metrics
-        metrics = MLMetrics.federated_learning_metrics(
-            client_accuracies,
-            communication_rounds,
-            client_losses,
-            model_divergences,
-            participation_rates
-        )
-        
+    n_clients = 10
+    seeds = hierarchy[2][:8]
+    for seed, metrics in zip(seeds, _map_trials(_run_fl_trial, seeds, max_workers)):
         # Track experiment
         manager.add_experiment_result(
             seed=seed,
@@ -254,11 +311,13 @@ def example_federated_learning():
             }
         )
         
-        print(f"  Seed {seed}:")
-        print(f"    Global accuracy: {metrics['global_accuracy']:.3f}")
-        print(f"    Accuracy variance: {metrics['accuracy_variance']:.4f}")
-        print(f"    Fairness (CV): {metrics['fairness_cv']:.3f}")
-        print(f"    Convergence: {metrics['convergence_indicator']:.3f}")
+        _report([
+            f"  Seed {seed}:",
+            f"    Global accuracy: {metrics['global_accuracy']:.3f}",
+            f"    Accuracy variance: {metrics['accuracy_variance']:.4f}",
+            f"    Fairness (CV): {metrics['fairness_cv']:.3f}",
+            f"    Convergence: {metrics['convergence_indicator']:.3f}"
+        ])
     
     # Get results
     df = manager.get_results_dataframe()
@@ -272,14 +331,15 @@ def example_federated_learning():
 
 def example_mixed_advanced_paradigms():
     """Example 4: Mixed Advanced ML Paradigms."""
-    print("=" * 70)
+    print(BANNER)
     print("Example 4: Mixed Advanced ML Paradigms")
-    print("=" * 70)
+    print(BANNER)
     
     manager = SeedExperimentManager("mixed_advanced_ml")
     
-    # Generate seeds
-    hierarchy = manager.generate_seed_hierarchy(
+    # Generate only the 9 sub-seeds used below
+    seeds = manager.generate_leaf_seeds(
+        9,
         n_seeds=4,
         n_sub_seeds=3,
         max_depth=2,
@@ -288,17 +348,16 @@ def example_mixed_advanced_paradigms():
     
     print(f"Running mixed experiments across all paradigms...\n")
     
-    seeds = hierarchy[2][:9]
     paradigms = ["semi_supervised", "reinforcement", "federated"] * 3
     
     for seed, paradigm in zip(seeds, paradigms):
-        random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         if paradigm == "semi_supervised":
             # Quick semi-supervised experiment
-            y_labeled_true = [random.randint(0, 1) for _ in range(50)]
-            y_labeled_pred = [val if random.random() > 0.1 else 1-val for val in y_labeled_true]
-            y_unlabeled_pseudo = [random.randint(0, 1) for _ in range(450)]
+            y_labeled_true = rng.integers(0, 2, 50)
+            y_labeled_pred = np.where(rng.random(50) < 0.1, 1 - y_labeled_true, y_labeled_true)
+            y_unlabeled_pseudo = rng.integers(0, 2, 450)
             
             metrics = MLMetrics.semi_supervised_metrics(
                 y_labeled_true, y_labeled_pred, y_unlabeled_pseudo
@@ -306,9 +365,9 @@ def example_mixed_advanced_paradigms():
             
         elif paradigm == "reinforcement":
             # Quick RL experiment
-            episode_rewards = [random.uniform(50, 200) for _ in range(50)]
-            episode_lengths = [random.randint(50, 200) for _ in range(50)]
-            success_flags = [r > 150 for r in episode_rewards]
+            episode_rewards = rng.uniform(50, 200, 50)
+            episode_lengths = rng.integers(50, 201, 50)
+            success_flags = episode_rewards > 150
             
             metrics = MLMetrics.reinforcement_learning_metrics(
                 episode_rewards, episode_lengths, success_flags
@@ -316,7 +375,7 @@ def example_mixed_advanced_paradigms():
             
         else:  # federated
             # Quick FL experiment
-            client_accuracies = [random.uniform(0.7, 0.95) for _ in range(5)]
+            client_accuracies = rng.uniform(0.7, 0.95, 5)
             communication_rounds = 20
             
             metrics = MLMetrics.federated_learning_metrics(
@@ -331,7 +390,7 @@ def example_mixed_advanced_paradigms():
             metadata={"paradigm": paradigm}
         )
         
-        print(f"  {paradigm:20} | Seed: {seed}")
+        _report([f"  {paradigm:20} | Seed: {seed}"])
     
     # Analysis
     df = manager.get_results_dataframe()
@@ -347,17 +406,19 @@ def example_mixed_advanced_paradigms():
 
 def example_export_and_analysis():
     """Example 5: Export and Analyze Advanced ML Results."""
-    print("=" * 70)
+    print(BANNER)
     print("Example 5: Export & Analysis")
-    print("=" * 70)
+    print(BANNER)
     
     # Run all experiments
     manager_ssl = example_semi_supervised_learning()
     
     # Export results
     try:
-        manager_ssl.export_results('advanced_ml_results.csv', format='csv')
-        manager_ssl.export_results('advanced_ml_results.json', format='json')
+        manager_ssl.export_results(
+            ['advanced_ml_results.csv', 'advanced_ml_results.json'],
+            format=['csv', 'json']
+        )
         
         print("✓ Results exported to:")
         print("  - advanced_ml_results.csv")
@@ -367,7 +428,7 @@ def example_export_and_analysis():
         summary = manager_ssl.get_summary_statistics()
         
         print("Summary Statistics:")
-        print("-" * 70)
+        print(RULE)
         print(f"  Total experiments: {summary['total_experiments']}")
         print(f"  ML tasks: {summary['ml_tasks']}")
         print(f"  Sampling methods: {summary['sampling_methods']}")
@@ -386,24 +447,22 @@ def example_export_and_analysis():
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("SEEDHASH: Advanced ML Paradigms Examples")
-    print("=" * 70 + "\n")
+    print(BANNER + "\n")
     
-    try:
-        import numpy as np
-        print("✓ NumPy available - all examples will run\n")
-    except ImportError:
+    if np is None:
         print("✗ NumPy not available - install with: pip install numpy\n")
         exit(1)
+    print("✓ NumPy available - all examples will run\n")
     
-    example_semi_supervised_learning()
+    example_semi_supervised_learning(max_workers=MAX_WORKERS)
     print()
     
-    example_reinforcement_learning()
+    example_reinforcement_learning(max_workers=MAX_WORKERS)
     print()
     
-    example_federated_learning()
+    example_federated_learning(max_workers=MAX_WORKERS)
     print()
     
     example_mixed_advanced_paradigms()
@@ -411,13 +470,13 @@ if __name__ == "__main__":
     
     example_export_and_analysis()
     
-    print("=" * 70)
+    print(BANNER)
     print("ALL ADVANCED ML EXAMPLES COMPLETED ✅")
-    print("=" * 70)
+    print(BANNER)
     print("\nKey Features Demonstrated:")
     print("  • Semi-Supervised Learning: label propagation, pseudo-labeling")
     print("  • Reinforcement Learning: episode rewards, success rates, Q-values")
     print("  • Federated Learning: client accuracy, fairness, convergence")
     print("  • Mixed Paradigms: combining multiple learning approaches")
     print("  • Comprehensive Metrics: specialized for each paradigm")
-    print("=" * 70 + "\n")
+    print(BANNER + "\n")
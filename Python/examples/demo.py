@@ -132,6 +132,11 @@ def simulation_example():
     print(f"Simulation ID: {simulation_id}")
     print(f"Number of parallel runs: {num_simulations}")
     print(f"Seeds: {simulation_seeds}")
+    
+    # Large sweeps are drawn in one vectorized batch (same seeds as a loop)
+    sweep_seeds = gen.generate_seeds(100_000)
+    print(f"Seeds for a 100,000-run sweep: {sweep_seeds[:5]}... "
+          f"({len(sweep_seeds)} total)")
     print()
 
 
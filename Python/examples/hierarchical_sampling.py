@@ -8,18 +8,163 @@ This script shows:
 4. Experiment tracking with pandas DataFrame
 """
 
+import contextlib
+import functools
+import importlib.util
+import io
+import os
 import sys
-sys.path.insert(0, 'Python')
 
-from seedhash import SeedHashGenerator, SeedExperimentManager, MLMetrics
-import random
+try:
+    from seedhash import SeedHashGenerator, SeedExperimentManager, MLMetrics
+except ImportError:
+    # Not installed: fall back to the in-repo package (run from repo root)
+    sys.path.insert(0, 'Python')
+    from seedhash import SeedHashGenerator, SeedExperimentManager, MLMetrics
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+# Banner strings shared by every example's output
+BANNER = "=" * 70
+RULE = "-" * 70
+LEVEL_NAMES = ("Master", "Seeds", "Sub-seeds", "Sub-sub-seeds")
+
+# Decorative banners/rules; set SEEDHASH_VERBOSE=0 to print only titles,
+# metrics and summaries
+VERBOSE = os.environ.get("SEEDHASH_VERBOSE", "1") == "1"
+
+# Set SEEDHASH_USE_NUMBA=1 to reduce simulated regression runs with the fused
+# Numba kernel (requires numba>=0.56); off by default since its JIT start-up
+# outweighs the gain for a few small runs
+USE_NUMBA = os.environ.get("SEEDHASH_USE_NUMBA", "0") == "1"
+
+
+def _rule(line):
+    """Print a decorative banner/rule line when VERBOSE is on."""
+    if VERBOSE:
+        print(line)
+
+
+def _emit(buf):
+    """Write everything collected in buf to stdout with a single call."""
+    sys.stdout.write(buf.getvalue())
+
+
+def _sim_regression_reductions(rng, n_samples, noise):
+    """Draw one simulated regression run and reduce it to RMSE, MAE, R², MAPE.
+    
+    Plain-Python source of the optional Numba kernel; see _get_sim_kernel.
+    """
+    y_true = rng.random(n_samples, dtype=np.float32) * np.float32(100.0)
+    # y_pred = y_true + noise, so the residual is just the noise draw
+    residual = (rng.random(n_samples, dtype=np.float32) * np.float32(2.0) - np.float32(1.0)) * noise
+    
+    mean_true = y_true.mean()
+    ss_res = 0.0
+    ss_tot = 0.0
+    abs_err = 0.0
+    pct_err = 0.0
+    n_nonzero = 0
+    for i in range(n_samples):
+        err = residual[i]
+        ss_res += err * err
+        abs_err += abs(err)
+        dev = y_true[i] - mean_true
+        ss_tot += dev * dev
+        if y_true[i] != 0.0:
+            pct_err += abs(err / y_true[i])
+            n_nonzero += 1
+    
+    rmse = np.sqrt(ss_res / n_samples)
+    r2 = 1.0 - ss_res / ss_tot if ss_tot != 0.0 else 0.0
+    mape = pct_err / n_nonzero * 100.0 if n_nonzero > 0 else 0.0
+    return rmse, abs_err / n_samples, r2, mape
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sim_kernel():
+    """Return the JIT-compiled _sim_regression_reductions.
+    
+    Numba is imported and the kernel compiled only on first use.
+    
+    Raises:
+        ImportError: If numba is not installed.
+    """
+    if importlib.util.find_spec("numba") is None:
+        raise ImportError(
+            "Numba is not installed. Install it with: pip install numba"
+        )
+    import numba
+    return numba.njit(cache=True)(_sim_regression_reductions)
+
+
+def _fused_regression_noise_metrics(rng, n_samples, noise):
+    """NumPy counterpart of _sim_regression_reductions.
+    
+    Predictions are y_true plus uniform noise, so the residuals are the noise
+    draw itself and y_pred never needs to be materialized.
+    """
+    y_true = rng.random(n_samples, dtype=np.float32) * np.float32(100.0)
+    residual = (rng.random(n_samples, dtype=np.float32) * np.float32(2.0) - np.float32(1.0)) * noise
+    
+    abs_residual = np.abs(residual)
+    ss_res = float(np.dot(residual, residual))
+    dev = y_true - y_true.mean()
+    ss_tot = float(np.dot(dev, dev))
+    nonzero = y_true != 0
+    
+    return {
+        'rmse': float(np.sqrt(ss_res / n_samples)),
+        'mae': float(abs_residual.mean()),
+        'r2': 1.0 - ss_res / ss_tot if ss_tot != 0 else 0.0,
+        'mape': float((abs_residual[nonzero] / y_true[nonzero]).mean() * 100) if nonzero.any() else 0.0,
+    }
+
+
+def _simulate_regression(seed, n_samples, noise, use_numba=False):
+    """Simulate a regression run for one seed and return its metrics.
+    
+    Values are drawn as float32 (ample precision for ±noise around 0-100),
+    which halves the memory traffic of the metric passes.
+    
+    Args:
+        use_numba: Reduce with the fused Numba kernel instead of NumPy. Both
+            consume the same random stream, but the kernel accumulates in a
+            different order, so metrics can differ in the last digits. Only
+            worth its JIT start-up cost for many or large runs.
+    """
+    rng = np.random.default_rng(seed)
+    noise = np.float32(noise)
+    
+    if use_numba:
+        rmse, mae, r2, mape = _get_sim_kernel()(rng, n_samples, noise)
+        return {'rmse': float(rmse), 'mae': float(mae), 'r2': float(r2), 'mape': float(mape)}
+    
+    return _fused_regression_noise_metrics(rng, n_samples, noise)
+
+
+def _buffered_output(func):
+    """Collect an example's printed output and emit it once when it returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            _emit(buf)
+    return wrapper
+
+
+@_buffered_output
 def example_simple_random_sampling():
     """Example 1: Simple Random Sampling for Regression Tasks."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 1: Simple Random Sampling - Regression")
-    print("=" * 70)
+    _rule(BANNER)
     
     # Initialize experiment manager
     manager = SeedExperimentManager("regression_baseline")
@@ -42,37 +187,33 @@ def example_simple_random_sampling():
     
     # Simulate regression experiments with different seeds
     print("Running regression experiments...")
+    if np is None:
+        print("  NumPy not available - skipping regression experiments")
+        print("\n✓ Simple random sampling completed\n")
+        return manager
+    
+    run_meta = {"model": "linear_regression", "n_samples": 50}
+    records = []
     for seed in hierarchy[2][:5]:  # Use first 5 sub-seeds
-        # Simulate a regression model run
-        random.seed(seed)
-        
-        # Simulated predictions vs true values
-        y_true = [random.uniform(0, 100) for _ in range(50)]
-        y_pred = [val + random.uniform(-10, 10) for val in y_true]
-        
-        # Calculate metrics
-        metrics = MLMetrics.regression_metrics(y_true, y_pred)
+        # Simulate a regression model run with an independent stream per seed
+        metrics = _simulate_regression(seed, n_samples=50, noise=10, use_numba=USE_NUMBA)
         
-        # Record experiment
-        manager.add_experiment_result(
-            seed=seed,
-            ml_task="regression",
-            metrics=metrics,
-            sampling_method="simple",
-            metadata={"model": "linear_regression", "n_samples": 50}
-        )
+        records.append((seed, metrics, "simple", run_meta.copy()))
         
         print(f"  Seed {seed}: RMSE={metrics['rmse']:.2f}, R²={metrics['r2']:.3f}")
     
+    manager.add_experiment_results_bulk(records, ml_task="regression")
+    
     print("\n✓ Simple random sampling completed\n")
     return manager
 
 
+@_buffered_output
 def example_stratified_sampling():
     """Example 2: Stratified Random Sampling for Classification Tasks."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 2: Stratified Random Sampling - Classification")
-    print("=" * 70)
+    _rule(BANNER)
     
     manager = SeedExperimentManager("classification_balanced")
     
@@ -94,34 +235,40 @@ def example_stratified_sampling():
     
     # Simulate classification experiments
     print("Running classification experiments...")
+    if np is None:
+        print("  NumPy not available - skipping classification experiments")
+        print("\n✓ Stratified sampling completed\n")
+        return manager
+    
+    run_meta = {"model": "random_forest", "n_classes": 2, "n_samples": 100}
+    records = []
+    classification_metrics = MLMetrics.classification_metrics
     for seed in hierarchy[2][:6]:
-        random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         # Simulated binary classification
-        y_true = [random.randint(0, 1) for _ in range(100)]
-        y_pred = [val if random.random() > 0.15 else 1 - val for val in y_true]
+        y_true = rng.integers(0, 2, size=100, dtype=np.int8)
+        flip_mask = rng.random(100) < 0.15
+        y_pred = np.where(flip_mask, 1 - y_true, y_true)
         
-        metrics = MLMetrics.classification_metrics(y_true, y_pred)
+        metrics = classification_metrics(y_true, y_pred)
         
-        manager.add_experiment_result(
-            seed=seed,
-            ml_task="classification",
-            metrics=metrics,
-            sampling_method="stratified",
-            metadata={"model": "random_forest", "n_classes": 2, "n_samples": 100}
-        )
+        records.append((seed, metrics, "stratified", run_meta.copy()))
         
         print(f"  Seed {seed}: Accuracy={metrics['accuracy']:.3f}, F1={metrics['f1']:.3f}")
     
+    manager.add_experiment_results_bulk(records, ml_task="classification")
+    
     print("\n✓ Stratified sampling completed\n")
     return manager
 
 
+@_buffered_output
 def example_cluster_sampling():
     """Example 3: Cluster Random Sampling for Unsupervised Learning."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 3: Cluster Random Sampling - Unsupervised Learning")
-    print("=" * 70)
+    _rule(BANNER)
     
     manager = SeedExperimentManager("clustering_analysis")
     
@@ -143,43 +290,42 @@ def example_cluster_sampling():
     
     # Simulate clustering experiments
     print("Running clustering experiments...")
-    try:
-        import numpy as np
+    if np is None:
+        print("  NumPy not available - skipping clustering experiments")
+        print("\n✓ Cluster sampling completed\n")
+        return manager
+    
+    n_samples = 150
+    run_meta = {"algorithm": "kmeans", "n_clusters": 3, "n_samples": n_samples}
+    records = []
+    clustering_metrics = MLMetrics.clustering_metrics
+    for seed in hierarchy[2][:5]:
+        rng = np.random.default_rng(seed)
+        
+        # Simulated clustering data
+        X = rng.standard_normal((n_samples, 2))
+        
+        # Simulated cluster labels
+        labels = rng.integers(0, 3, n_samples)
+        
+        metrics = clustering_metrics(X, labels)
         
-        for seed in hierarchy[2][:5]:
-            np.random.seed(seed)
-            
-            # Simulated clustering data
-            n_samples = 150
-            X = np.random.randn(n_samples, 2)
-            
-            # Simulated cluster labels
-            labels = np.random.randint(0, 3, n_samples)
-            
-            metrics = MLMetrics.clustering_metrics(X, labels)
-            
-            manager.add_experiment_result(
-                seed=seed,
-                ml_task="unsupervised",
-                metrics=metrics,
-                sampling_method="cluster",
-                metadata={"algorithm": "kmeans", "n_clusters": 3, "n_samples": n_samples}
-            )
-            
-            print(f"  Seed {seed}: Silhouette={metrics['silhouette']:.3f}, Clusters={metrics['n_clusters']}")
+        records.append((seed, metrics, "cluster", run_meta.copy()))
+        
+        print(f"  Seed {seed}: Silhouette={metrics['silhouette']:.3f}, Clusters={metrics['n_clusters']}")
     
-    except ImportError:
-        print("  NumPy not available - skipping clustering example")
+    manager.add_experiment_results_bulk(records, ml_task="unsupervised")
     
     print("\n✓ Cluster sampling completed\n")
     return manager
 
 
+@_buffered_output
 def example_systematic_sampling():
     """Example 4: Systematic Random Sampling for Mixed Tasks."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 4: Systematic Random Sampling - Mixed ML Tasks")
-    print("=" * 70)
+    _rule(BANNER)
     
     manager = SeedExperimentManager("mixed_tasks_systematic")
     
@@ -201,28 +347,33 @@ def example_systematic_sampling():
     
     # Run mixed ML tasks
     print("Running mixed ML tasks...")
+    if np is None:
+        print("  NumPy not available - skipping mixed ML tasks")
+        print("\n✓ Systematic sampling completed\n")
+        return manager
+    
     seeds = hierarchy[2][:8]
+    classification_metrics = MLMetrics.classification_metrics
+    add_result = manager.add_experiment_result
     
     for i, seed in enumerate(seeds):
-        random.seed(seed)
-        
         # Alternate between regression and classification
         if i % 2 == 0:
             # Regression
-            y_true = [random.uniform(0, 100) for _ in range(30)]
-            y_pred = [val + random.uniform(-5, 5) for val in y_true]
-            metrics = MLMetrics.regression_metrics(y_true, y_pred)
+            metrics = _simulate_regression(seed, n_samples=30, noise=5, use_numba=USE_NUMBA)
             task = "regression"
             print(f"  Seed {seed} [Regression]: RMSE={metrics['rmse']:.2f}")
         else:
             # Classification
-            y_true = [random.randint(0, 1) for _ in range(30)]
-            y_pred = [val if random.random() > 0.1 else 1 - val for val in y_true]
-            metrics = MLMetrics.classification_metrics(y_true, y_pred)
+            rng = np.random.default_rng(seed)
+            y_true = rng.integers(0, 2, size=30, dtype=np.int8)
+            flip_mask = rng.random(30) < 0.1
+            y_pred = np.where(flip_mask, 1 - y_true, y_true)
+            metrics = classification_metrics(y_true, y_pred)
             task = "classification"
             print(f"  Seed {seed} [Classification]: Accuracy={metrics['accuracy']:.3f}")
         
-        manager.add_experiment_result(
+        add_result(
             seed=seed,
             ml_task=task,
             metrics=metrics,
@@ -234,11 +385,12 @@ def example_systematic_sampling():
     return manager
 
 
+@_buffered_output
 def example_deep_hierarchy():
     """Example 5: Deep Hierarchy with 3+ Levels."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 5: Deep Seed Hierarchy (Master → Seeds → Sub-seeds → Sub-sub-seeds)")
-    print("=" * 70)
+    _rule(BANNER)
     
     manager = SeedExperimentManager("deep_hierarchy_test")
     
@@ -254,20 +406,20 @@ def example_deep_hierarchy():
     
     print("Deep Hierarchy Structure:")
     for level, seeds in hierarchy.items():
-        level_names = ["Master", "Seeds", "Sub-seeds", "Sub-sub-seeds"]
-        print(f"  Level {level} ({level_names[level]}): {len(seeds)} seeds")
+        print(f"  Level {level} ({LEVEL_NAMES[level]}): {len(seeds)} seeds")
     
-    print(f"\nTotal seeds generated: {sum(len(seeds) for seeds in hierarchy.values())}")
+    print(f"\nTotal seeds generated: {sum(map(len, hierarchy.values()))}")
     print("✓ Deep hierarchy generated\n")
     
     return manager
 
 
+@_buffered_output
 def example_comparison_all_methods():
     """Example 6: Compare All Sampling Methods."""
-    print("=" * 70)
+    _rule(BANNER)
     print("Example 6: Comparing All Sampling Methods")
-    print("=" * 70)
+    _rule(BANNER)
     
     methods = ["simple", "stratified", "cluster", "systematic"]
     results = {}
@@ -290,7 +442,7 @@ def example_comparison_all_methods():
         }
     
     print("\nSampling Method Comparison:")
-    print("-" * 70)
+    _rule(RULE)
     for method, stats in results.items():
         print(f"{method.capitalize():15} | Master: {stats['master_seed']:10} | "
               f"Level 1: {stats['level_1']:3} | Level 2: {stats['level_2']:3}")
@@ -298,23 +450,30 @@ def example_comparison_all_methods():
     print("\n✓ All methods compared\n")
 
 
-def example_export_results():
-    """Example 7: Export Results to DataFrame and Files."""
-    print("=" * 70)
+@_buffered_output
+def example_export_results(manager=None):
+    """Example 7: Export Results to DataFrame and Files.
+    
+    Args:
+        manager: Manager returned by example_simple_random_sampling(). The
+            example is re-run to produce one if not supplied.
+    """
+    _rule(BANNER)
     print("Example 7: Exporting Results to DataFrame")
-    print("=" * 70)
+    _rule(BANNER)
     
     try:
         import pandas as pd
         
-        # Run experiments
-        manager = example_simple_random_sampling()
+        # Run experiments unless results were passed in
+        if manager is None:
+            manager = example_simple_random_sampling()
         
         # Get DataFrame
         df = manager.get_results_dataframe()
         
         print("\nExperiment Results DataFrame:")
-        print("-" * 70)
+        _rule(RULE)
         print(df.to_string(index=False))
         
         print("\n\nDataFrame Info:")
@@ -324,7 +483,7 @@ def example_export_results():
         # Get summary statistics
         summary = manager.get_summary_statistics()
         print("\n\nSummary Statistics:")
-        print("-" * 70)
+        _rule(RULE)
         for key, value in summary.items():
             print(f"  {key}: {value}")
         
@@ -341,22 +500,22 @@ def example_export_results():
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 70)
+    _rule("\n" + BANNER)
     print("SEEDHASH: Hierarchical Sampling & ML Experiment Tracking")
-    print("=" * 70 + "\n")
+    _rule(BANNER + "\n")
     
     # Run all examples
-    example_simple_random_sampling()
+    simple_manager = example_simple_random_sampling()
     example_stratified_sampling()
     example_cluster_sampling()
     example_systematic_sampling()
     example_deep_hierarchy()
     example_comparison_all_methods()
-    example_export_results()
+    example_export_results(simple_manager)
     
-    print("=" * 70)
+    _rule(BANNER)
     print("ALL EXAMPLES COMPLETED ✅")
-    print("=" * 70)
+    _rule(BANNER)
     print("\nKey Features Demonstrated:")
     print("  • 4 Sampling Methods: simple, stratified, cluster, systematic")
     print("  • Hierarchical Seeds: master → seeds → sub-seeds → ...")
@@ -364,4 +523,4 @@ if __name__ == "__main__":
     print("  • Metrics: RMSE, R², accuracy, F1, silhouette score")
     print("  • DataFrame Export: CSV, JSON formats")
     print("  • Summary Statistics: aggregated across all experiments")
-    print("=" * 70 + "\n")
+    _rule(BANNER + "\n")
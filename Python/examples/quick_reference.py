@@ -4,10 +4,30 @@ Quick reference guide for hierarchical seed sampling and experiment management.
 This is a condensed guide showing the most common use cases.
 """
 
+import os
 import sys
-sys.path.insert(0, 'Python')
 
-from seedhash import SeedExperimentManager, MLMetrics
+try:
+    from seedhash import SeedExperimentManager, MLMetrics
+except ImportError:
+    # Not installed: fall back to the in-repo package (run from repo root)
+    sys.path.insert(0, 'Python')
+    from seedhash import SeedExperimentManager, MLMetrics
+
+# Banner strings shared by every example's output
+BANNER = "=" * 70
+RULE = "-" * 70
+LEVEL_NAMES = ("Master", "Seeds", "Sub-seeds", "Sub-sub-seeds")
+
+# Decorative banners/rules; set SEEDHASH_VERBOSE=0 to print only titles,
+# metrics and summaries
+VERBOSE = os.environ.get("SEEDHASH_VERBOSE", "1") == "1"
+
+
+def _rule(line):
+    """Print a decorative banner/rule line when VERBOSE is on."""
+    if VERBOSE:
+        print(line)
 
 
 # ============================================================================
@@ -39,7 +59,7 @@ def quick_start():
 def ml_workflow_example():
     """Complete ML experiment workflow."""
     
-    import random
+    import numpy as np
     
     # Initialize
     manager = SeedExperimentManager("regression_benchmark")
@@ -52,19 +72,21 @@ def ml_workflow_example():
         sampling_method="stratified"
     )
     
-    # Run experiments
+    # Run experiments (hot-loop callables bound once)
+    regression_metrics = MLMetrics.regression_metrics
+    add_result = manager.add_experiment_result
     for seed in hierarchy[2][:20]:  # Use 20 seeds
-        random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         # Simulated model training
-        y_true = [random.uniform(0, 100) for _ in range(100)]
-        y_pred = [val + random.uniform(-5, 5) for val in y_true]
+        y_true = rng.random(100, dtype=np.float32) * np.float32(100)
+        y_pred = y_true + (rng.random(100, dtype=np.float32) * np.float32(10) - np.float32(5))
         
         # Calculate metrics
-        metrics = MLMetrics.regression_metrics(y_true, y_pred)
+        metrics = regression_metrics(y_true, y_pred)
         
         # Track result
-        manager.add_experiment_result(
+        add_result(
             seed=seed,
             ml_task="regression",
             metrics=metrics,
@@ -94,9 +116,9 @@ def compare_sampling_methods():
     
     methods = ["simple", "stratified", "cluster", "systematic"]
     
-    print("\n" + "="*70)
+    _rule("\n" + BANNER)
     print("Comparing Sampling Methods")
-    print("="*70 + "\n")
+    _rule(BANNER + "\n")
     
     for method in methods:
         manager = SeedExperimentManager(f"test_{method}")
@@ -126,15 +148,14 @@ def deep_hierarchy_example():
         sampling_method="systematic"
     )
     
-    print("\n" + "="*70)
+    _rule("\n" + BANNER)
     print("Deep Hierarchy Structure")
-    print("="*70)
+    _rule(BANNER)
     
-    level_names = ["Master", "Seeds", "Sub-seeds", "Sub-sub-seeds"]
     for level, seeds in hierarchy.items():
-        print(f"Level {level} ({level_names[level]:13}): {len(seeds):3} seeds")
+        print(f"Level {level} ({LEVEL_NAMES[level]:13}): {len(seeds):3} seeds")
     
-    total = sum(len(seeds) for seeds in hierarchy.values())
+    total = sum(map(len, hierarchy.values()))
     print(f"\nTotal seeds in hierarchy: {total}")
 
 
@@ -142,18 +163,24 @@ def deep_hierarchy_example():
 # USE CASE 5: DataFrame Analysis
 # ============================================================================
 
-def dataframe_analysis():
-    """Analyze results using DataFrame."""
+def dataframe_analysis(manager=None):
+    """Analyze results using DataFrame.
+    
+    Args:
+        manager: Manager returned by ml_workflow_example(). The workflow is
+            re-run to produce one if not supplied.
+    """
     
     try:
         import pandas as pd
         
-        manager = ml_workflow_example()
+        if manager is None:
+            manager = ml_workflow_example()
         df = manager.get_results_dataframe()
         
-        print("\n" + "="*70)
+        _rule("\n" + BANNER)
         print("DataFrame Analysis")
-        print("="*70 + "\n")
+        _rule(BANNER + "\n")
         
         # Basic stats
         print("Metric Statistics:")
@@ -247,23 +274,23 @@ def print_cheat_sheet():
 # ============================================================================
 
 if __name__ == "__main__":
-    print("\n" + "="*70)
+    _rule("\n" + BANNER)
     print("SEEDHASH - Quick Reference Examples")
-    print("="*70 + "\n")
+    _rule(BANNER + "\n")
     
     print_cheat_sheet()
     
-    print("\n" + "="*70)
+    _rule("\n" + BANNER)
     print("Running Examples...")
-    print("="*70 + "\n")
+    _rule(BANNER + "\n")
     
     print("Example 1: Quick Start")
-    print("-" * 70)
+    _rule(RULE)
     quick_start()
     
     print("\n\nExample 2: ML Workflow")
-    print("-" * 70)
-    ml_workflow_example()
+    _rule(RULE)
+    workflow_manager = ml_workflow_example()
     
     print("\n\nExample 3: Comparing Sampling Methods")
     compare_sampling_methods()
@@ -272,8 +299,8 @@ if __name__ == "__main__":
     deep_hierarchy_example()
     
     print("\n\nExample 5: DataFrame Analysis")
-    dataframe_analysis()
+    dataframe_analysis(workflow_manager)
     
-    print("\n" + "="*70)
+    _rule("\n" + BANNER)
     print("All examples completed! ✅")
-    print("="*70 + "\n")
+    _rule(BANNER + "\n")
@@ -11,7 +11,7 @@ Features:
 - ML experiment tracking with pandas DataFrame output
 """
 
-from .core import SeedHashGenerator
+from .core import SeedHashGenerator, FrozenSeedHash
 from .experiment import (
     SeedExperimentManager,
     SeedSampler,
@@ -23,6 +23,7 @@ __version__ = "0.3.0"
 __author__ = "melhzy"
 __all__ = [
     "SeedHashGenerator",
+    "FrozenSeedHash",
     "SeedExperimentManager",
     "SeedSampler",
     "MLMetrics",
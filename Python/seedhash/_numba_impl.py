@@ -0,0 +1,73 @@
+"""Optional Numba kernels for MLMetrics.
+
+Numba is imported and the kernels are compiled only on first use, so importing
+seedhash never pays the JIT start-up cost.
+"""
+
+import functools
+import importlib.util
+import math
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _ssl_reductions(y_true, y_pred, confidence, consistency):
+    """Single-pass reductions behind MLMetrics.semi_supervised_metrics.
+
+    Empty confidence/consistency arrays mean "not provided"; their statistics
+    are NaN, as NumPy's mean/std of an empty array are.
+
+    Returns:
+        (n_correct, avg_confidence, high_confidence_ratio,
+         avg_consistency, consistency_std)
+    """
+    n_correct = 0
+    for i in range(y_true.shape[0]):
+        if y_true[i] == y_pred[i]:
+            n_correct += 1
+
+    avg_confidence = math.nan
+    high_confidence_ratio = math.nan
+    n_conf = confidence.shape[0]
+    if n_conf > 0:
+        total = 0.0
+        n_high = 0
+        for i in range(n_conf):
+            total += confidence[i]
+            if confidence[i] > 0.9:
+                n_high += 1
+        avg_confidence = total / n_conf
+        high_confidence_ratio = n_high / n_conf
+
+    avg_consistency = math.nan
+    consistency_std = math.nan
+    n_cons = consistency.shape[0]
+    if n_cons > 0:
+        total = 0.0
+        for i in range(n_cons):
+            total += consistency[i]
+        avg_consistency = total / n_cons
+
+        # Second pass keeps the variance numerically stable
+        sq_dev = 0.0
+        for i in range(n_cons):
+            diff = consistency[i] - avg_consistency
+            sq_dev += diff * diff
+        consistency_std = (sq_dev / n_cons) ** 0.5
+
+    return n_correct, avg_confidence, high_confidence_ratio, avg_consistency, consistency_std
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_kernel():
+    """Return the JIT-compiled semi-supervised reduction kernel.
+
+    Raises:
+        ImportError: If numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        raise ImportError(
+            "Numba is not installed. Install it with: pip install numba"
+        )
+    import numba
+    return numba.njit(cache=True)(_ssl_reductions)
@@ -1,24 +1,21 @@
 """Core module for seed generation using hash-based initialization."""
 
 import random
+import functools
 import hashlib
+import importlib.util
 import os
+import sys
+import threading
 import warnings
-from typing import List, Optional, Literal
+from dataclasses import dataclass, field
+from typing import List, Optional, Literal, Iterable, Union
 
 
-# Optional deep learning framework imports
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-
-try:
-    import tensorflow as tf
-    TF_AVAILABLE = True
-except ImportError:
-    TF_AVAILABLE = False
+# Optional deep learning frameworks. Only probe for them here; the (slow)
+# imports happen in set_seed when a framework is actually seeded.
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+TF_AVAILABLE = importlib.util.find_spec("tensorflow") is not None
 
 try:
     import numpy as np
@@ -26,8 +23,294 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
+# Optional faster hash backend
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 
 FrameworkType = Literal["torch", "tensorflow", "numpy", "all", "python"]
+HashAlgorithm = Literal["md5", "blake2b", "blake3"]
+HASH_ALGORITHMS = ("md5", "blake2b", "blake3")
+
+
+def _check_algorithm(algorithm: str) -> None:
+    """Validate a hash algorithm name and that its backend is installed."""
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(
+            f"Invalid algorithm '{algorithm}'. Must be one of: {list(HASH_ALGORITHMS)}"
+        )
+    if algorithm == "blake3" and not BLAKE3_AVAILABLE:
+        raise ImportError(
+            "BLAKE3 is not installed. Install it with: pip install blake3"
+        )
+
+
+def _hash_bytes(data: bytes, algorithm: str) -> bytes:
+    """Return the 16-byte digest of data under the given hash algorithm."""
+    if algorithm == "blake3":
+        return blake3.blake3(data).digest(length=16)
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=16).digest()
+    return hashlib.md5(data).digest()
+
+
+def _new_hash(data: bytes, algorithm: str):
+    """Return a hash object for the given algorithm, fed with data (copyable)."""
+    if algorithm == "blake3":
+        return blake3.blake3(data)
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=16)
+    return hashlib.md5(data)
+
+
+def _hash_digest(hasher, algorithm: str) -> bytes:
+    """Return the 16-byte digest of a hash object made by _new_hash."""
+    if algorithm == "blake3":
+        return hasher.digest(length=16)
+    return hasher.digest()
+
+
+# Below this many draws the getrandbits loop beats loading NumPy's MT19937
+_RANDINT_BATCH_MIN = 1024
+
+# Words per getrandbits call when fast-forwarding a Random past a batch; keeps
+# the throwaway int small however large the batch was
+_ADVANCE_CHUNK_WORDS = 1 << 16
+
+_thread_local = threading.local()
+
+
+def _randint_seeds(
+    rng: random.Random,
+    a: int,
+    b: int,
+    count: int,
+    advance_rng: bool = True
+) -> List[int]:
+    """``[rng.randint(a, b) for _ in range(count)]``, via the fastest exact path.
+    
+    Large batches run through NumPy's MT19937 (same stream and rejection
+    sampling, in C); small ones through the direct getrandbits loop.
+    Pass advance_rng=False when rng is discarded afterwards (see _randint_batch).
+    """
+    if count >= _RANDINT_BATCH_MIN:
+        seeds = _randint_batch(rng, a, b, count, advance_rng)
+        if seeds is not None:
+            return seeds.tolist()
+    return _randint_loop(rng, a, b, count)
+
+
+def _randint_loop(rng: random.Random, a: int, b: int, count: int) -> List[int]:
+    """Pure-Python, bit-exact equivalent of ``[rng.randint(a, b) for _ in range(count)]``.
+    
+    randint(a, b) is a + _randbelow(span), which draws getrandbits(k) with
+    k = span.bit_length() until the value is below span. Calling getrandbits
+    directly skips the randint -> randrange -> _randbelow call chain.
+    """
+    span = b - a + 1
+    if span <= 0:
+        raise ValueError(f"empty range in randint({a}, {b})")
+    k = span.bit_length()
+    getrandbits = rng.getrandbits
+    seeds = []
+    append = seeds.append
+    while len(seeds) < count:
+        r = getrandbits(k)
+        if r < span:
+            append(a + r)
+    return seeds
+
+
+def _mt19937() -> "np.random.MT19937":
+    """Per-thread scratch MT19937; constructing one costs far more than reseeding it."""
+    bitgen = getattr(_thread_local, "mt19937", None)
+    if bitgen is None:
+        bitgen = _thread_local.mt19937 = np.random.MT19937(0)
+    return bitgen
+
+
+def _randint_batch(
+    rng: random.Random,
+    a: int,
+    b: int,
+    count: int,
+    advance_rng: bool = True
+) -> Optional["np.ndarray"]:
+    """Vectorized, bit-exact equivalent of ``[rng.randint(a, b) for _ in range(count)]``.
+    
+    random.Random.randint draws getrandbits(k) from MT19937 and rejects values
+    >= b - a + 1. NumPy's MT19937 is loaded with the same state, so the raw
+    32-bit words come from C and the rejection step is done with array ops.
+    rng is left in exactly the state the Python loop would leave it in,
+    unless advance_rng is False: callers that throw rng away afterwards skip
+    fast-forwarding it, and its state is then unspecified.
+    
+    Returns:
+        An int64 array, or None if NumPy is missing or the range does not fit
+        the fast path (span above 2^64 or bounds outside int64). Callers then
+        fall back to the Python loop.
+    """
+    if not NUMPY_AVAILABLE or count <= 0:
+        return None
+    span = b - a + 1
+    k = span.bit_length()
+    if span <= 0 or k > 64 or a < -2**63 or b >= 2**63:
+        return None
+    
+    # getrandbits(k) uses one word for k <= 32, else two (low word first)
+    words_per_draw = 1 if k <= 32 else 2
+    internal_state = rng.getstate()[1]
+    bitgen = _mt19937()
+    bitgen.state = {
+        'bit_generator': 'MT19937',
+        'state': {'key': np.array(internal_state[:-1], dtype=np.uint32),
+                  'pos': internal_state[-1]},
+    }
+    
+    # Accepted draws are offset by a and written straight into the result
+    seeds = np.empty(count, dtype=np.int64)
+    offset = np.int64(a)
+    n_found = 0
+    n_words = 0
+    while n_found < count:
+        need = count - n_found
+        # Acceptance probability is at least 1/2
+        n_draws = 2 * need + 16
+        raw = bitgen.random_raw(n_draws * words_per_draw)
+        if words_per_draw == 1:
+            draws = raw >> np.uint64(32 - k)
+        else:
+            pairs = raw.reshape(-1, 2)
+            draws = pairs[:, 0] | ((pairs[:, 1] >> np.uint64(64 - k)) << np.uint64(32))
+        accepted = np.flatnonzero(draws < np.uint64(span))
+        if len(accepted) >= need:
+            accepted = accepted[:need]
+            n_draws = int(accepted[-1]) + 1
+        # Wrapping int64 arithmetic is exact because every result fits in int64
+        np.add(draws[accepted].view(np.int64), offset,
+               out=seeds[n_found:n_found + len(accepted)])
+        n_found += len(accepted)
+        n_words += n_draws * words_per_draw
+    
+    # Advance rng past exactly the words the Python loop would have consumed;
+    # getrandbits(32 * n) consumes exactly n words
+    if advance_rng:
+        getrandbits = rng.getrandbits
+        for _ in range(n_words // _ADVANCE_CHUNK_WORDS):
+            getrandbits(32 * _ADVANCE_CHUNK_WORDS)
+        if n_words % _ADVANCE_CHUNK_WORDS:
+            getrandbits(32 * (n_words % _ADVANCE_CHUNK_WORDS))
+    return seeds
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_import(name: str):
+    """Import an optional framework on first use.
+    
+    Returns:
+        The module, or None if it is installed but fails to import.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _set_env(name: str, value: str) -> None:
+    """Set an environment variable only if it changes (each write calls putenv)."""
+    if os.environ.get(name) != value:
+        os.environ[name] = value
+
+
+def _seed_python(seed_number: int, deterministic: bool) -> Optional[str]:
+    """Seed Python's global random module."""
+    random.seed(seed_number)
+    return "seeded"
+
+
+def _seed_numpy(seed_number: int, deterministic: bool) -> Optional[str]:
+    """Seed NumPy's global RandomState; None if NumPy is not installed."""
+    if not NUMPY_AVAILABLE:
+        return None
+    np.random.seed(seed_number)
+    return "seeded"
+
+
+def _seed_torch(seed_number: int, deterministic: bool) -> Optional[str]:
+    """Seed PyTorch (and CUDA); None if PyTorch is not installed."""
+    torch = _lazy_import("torch") if TORCH_AVAILABLE else None
+    if torch is None:
+        return None
+    # Also seeds every CUDA device (lazily, without initializing CUDA)
+    torch.manual_seed(seed_number)
+    
+    # Enable deterministic mode if requested. These are process-wide switches
+    # and flipping them resets cuDNN's algorithm cache, so only write on change.
+    if deterministic:
+        # Set deterministic algorithms
+        if not (torch.are_deterministic_algorithms_enabled()
+                and torch.is_deterministic_algorithms_warn_only_enabled()):
+            torch.use_deterministic_algorithms(True, warn_only=True)
+        
+        # Set CUDNN to deterministic mode
+        if not torch.backends.cudnn.deterministic:
+            torch.backends.cudnn.deterministic = True
+        if torch.backends.cudnn.benchmark:
+            torch.backends.cudnn.benchmark = False
+        
+        # Set environment variables for CUBLAS
+        _set_env('CUBLAS_WORKSPACE_CONFIG', ':4096:8')
+    
+    return "seeded" + ("_deterministic" if deterministic else "")
+
+
+def _seed_tensorflow(seed_number: int, deterministic: bool) -> Optional[str]:
+    """Seed TensorFlow; None if TensorFlow is not installed."""
+    tf = _lazy_import("tensorflow") if TF_AVAILABLE else None
+    if tf is None:
+        return None
+    tf.random.set_seed(seed_number)
+    
+    # Set deterministic operations if requested
+    if deterministic:
+        _set_env('TF_DETERMINISTIC_OPS', '1')
+        _set_env('TF_CUDNN_DETERMINISTIC', '1')
+    
+    return "seeded" + ("_deterministic" if deterministic else "")
+
+
+# set_seed dispatch: framework option -> frameworks seeded, in order
+_FRAMEWORK_GROUPS = {
+    "torch": ("python", "torch"),
+    "tensorflow": ("python", "tensorflow"),
+    "numpy": ("python", "numpy"),
+    "all": ("python", "numpy", "torch", "tensorflow"),
+    "python": ("python",),
+}
+_SEEDERS = {
+    "python": _seed_python,
+    "numpy": _seed_numpy,
+    "torch": _seed_torch,
+    "tensorflow": _seed_tensorflow,
+}
+_INSTALL_HINTS = {
+    "numpy": "NumPy is not installed. Install it with: pip install numpy",
+    "torch": "PyTorch is not installed. Install it with: pip install torch",
+    "tensorflow": "TensorFlow is not installed. Install it with: pip install tensorflow",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _string_digest(input_string: str, algorithm: str) -> bytes:
+    """Memoized digest of a UTF-8 string.
+    
+    Sweeps tend to rebuild generators from the same handful of strings, so
+    repeat constructions skip hashing entirely.
+    """
+    return _hash_bytes(input_string.encode('utf-8'), algorithm)
 
 
 class SeedHashGenerator:
@@ -41,6 +324,8 @@ class SeedHashGenerator:
         input_string (str): The string used to generate the initial seed.
         min_value (int): Minimum value for generated random numbers (inclusive).
         max_value (int): Maximum value for generated random numbers (inclusive).
+        algorithm (str): Hash algorithm used to derive the seed ("md5",
+            "blake2b" or "blake3").
         seed_number (int): The integer seed derived from hashing the input string.
     
     Example:
@@ -52,11 +337,18 @@ class SeedHashGenerator:
     DEFAULT_MIN = 0
     DEFAULT_MAX = 2**31 - 1
     
+    # Fixed attribute set: smaller instances for large sweeps
+    __slots__ = (
+        "input_string", "min_value", "max_value", "algorithm",
+        "seed_number", "_digest_bytes", "__weakref__",
+    )
+    
     def __init__(
         self, 
         input_string: str,
         min_value: Optional[int] = None,
-        max_value: Optional[int] = None
+        max_value: Optional[int] = None,
+        algorithm: HashAlgorithm = "md5"
     ):
         """Initialize the SeedHashGenerator.
         
@@ -64,10 +356,15 @@ class SeedHashGenerator:
             input_string: The string to hash for seed generation.
             min_value: Minimum value for random number range (default: 0).
             max_value: Maximum value for random number range (default: 2^31 - 1).
+            algorithm: Hash algorithm for seed derivation (default: "md5").
+                "blake2b" (standard library) and "blake3" (optional blake3
+                package) produce different seeds than MD5.
             
         Raises:
-            ValueError: If input_string is empty or if min_value >= max_value.
+            ValueError: If input_string is empty, if min_value >= max_value,
+                or if algorithm is not supported.
             TypeError: If input_string is not a string.
+            ImportError: If algorithm="blake3" and blake3 is not installed.
         """
         if not isinstance(input_string, str):
             raise TypeError("input_string must be a string")
@@ -75,35 +372,144 @@ class SeedHashGenerator:
         if not input_string:
             raise ValueError("input_string cannot be empty")
         
-        self.input_string = input_string
-        self.min_value = min_value if min_value is not None else self.DEFAULT_MIN
-        self.max_value = max_value if max_value is not None else self.DEFAULT_MAX
+        if min_value is None:
+            min_value = self.DEFAULT_MIN
+        if max_value is None:
+            max_value = self.DEFAULT_MAX
         
-        # Validate range
-        if not isinstance(self.min_value, int):
+        # Validate range (on locals; slot reads cost more than the checks)
+        if not isinstance(min_value, int):
             raise TypeError("min_value must be an integer")
-        if not isinstance(self.max_value, int):
+        if not isinstance(max_value, int):
             raise TypeError("max_value must be an integer")
-        if self.min_value >= self.max_value:
+        if min_value >= max_value:
             raise ValueError(
-                f"min_value ({self.min_value}) must be less than "
-                f"max_value ({self.max_value})"
+                f"min_value ({min_value}) must be less than "
+                f"max_value ({max_value})"
             )
         
+        # MD5 (the default) is always available
+        if algorithm != "md5":
+            _check_algorithm(algorithm)
+        
+        self.input_string = input_string
+        self.min_value = min_value
+        self.max_value = max_value
+        self.algorithm = algorithm
+        
+        # Hash once; seed_number and get_hash() both read this digest
+        self._digest_bytes = _string_digest(input_string, algorithm)
+        
         # Generate the seed from the input string
         self.seed_number = self._generate_seed()
         
+    @classmethod
+    def unchecked(
+        cls,
+        input_string: str,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        algorithm: HashAlgorithm = "md5"
+    ) -> "SeedHashGenerator":
+        """Construct a generator without validating the arguments.
+        
+        Meant for tight loops that build many generators from inputs already
+        known to be valid. Invalid arguments are not reported and give
+        undefined results, so prefer the normal constructor elsewhere.
+        
+        Example:
+            >>> gens = [SeedHashGenerator.unchecked(f"run_{i}") for i in range(10000)]
+        """
+        self = cls.__new__(cls)
+        self.input_string = input_string
+        self.min_value = min_value if min_value is not None else cls.DEFAULT_MIN
+        self.max_value = max_value if max_value is not None else cls.DEFAULT_MAX
+        self.algorithm = algorithm
+        self._digest_bytes = _string_digest(input_string, algorithm)
+        self.seed_number = self._generate_seed()
+        return self
+    
+    def _digest(self) -> bytes:
+        """Return the digest of the input string under the configured algorithm.
+        
+        Returns:
+            The 16-byte digest of the UTF-8 encoded input string.
+        """
+        return self._digest_bytes
+    
     def _generate_seed(self) -> int:
-        """Generate an integer seed from the input string using MD5 hashing.
+        """Generate an integer seed from the input string hash.
         
         Returns:
-            An integer representation of the MD5 hash (modulo 2^32 for compatibility).
+            An integer representation of the hash (modulo 2^32 for compatibility).
         """
-        md5_hasher = hashlib.md5()
-        md5_hasher.update(self.input_string.encode('utf-8'))
-        hashed_value = md5_hasher.hexdigest()
-        # Use modulo 2^32 to ensure compatibility with all frameworks
-        return int(hashed_value, 16) % (2**32)
+        # The digest modulo 2^32 (for compatibility with all frameworks) is just
+        # its last 4 bytes read big-endian; no 128-bit int or modulo needed
+        return int.from_bytes(self._digest()[-4:], 'big')
+    
+    @classmethod
+    def seed_numbers(
+        cls,
+        input_strings: Iterable[str],
+        algorithm: HashAlgorithm = "md5",
+        prefix: str = ""
+    ) -> Union["np.ndarray", List[int]]:
+        """Derive seed numbers for many input strings at once.
+        
+        Equivalent to ``[SeedHashGenerator(prefix + s, algorithm=algorithm).seed_number
+        for s in input_strings]`` without constructing a generator per string.
+        With NumPy the digests are joined into one buffer and the seeds are read
+        from it in a single np.frombuffer call.
+        
+        Args:
+            input_strings: Strings to derive seeds from.
+            algorithm: Hash algorithm for seed derivation (default: "md5").
+            prefix: Common prefix of every input (e.g. "my_project/"). It is
+                hashed once and the hash state is copied per input, instead
+                of rehashing the shared bytes for every string.
+        
+        Returns:
+            A uint32 NumPy array of seeds, or a list of ints if NumPy is not
+            installed.
+        
+        Raises:
+            ValueError: If a string is empty or algorithm is not supported.
+            TypeError: If an input is not a string.
+            ImportError: If algorithm="blake3" and blake3 is not installed.
+        
+        Example:
+            >>> SeedHashGenerator.seed_numbers(["run_1", "run_2", "run_3"])
+            >>> SeedHashGenerator.seed_numbers(["1", "2", "3"], prefix="run_")
+        """
+        _check_algorithm(algorithm)
+        if not isinstance(prefix, str):
+            raise TypeError("prefix must be a string")
+        
+        digests = bytearray()
+        if prefix:
+            base = _new_hash(prefix.encode('utf-8'), algorithm)
+            for input_string in input_strings:
+                if not isinstance(input_string, str):
+                    raise TypeError("input_string must be a string")
+                hasher = base.copy()
+                hasher.update(input_string.encode('utf-8'))
+                digests += _hash_digest(hasher, algorithm)
+        else:
+            for input_string in input_strings:
+                if not isinstance(input_string, str):
+                    raise TypeError("input_string must be a string")
+                if not input_string:
+                    raise ValueError("input_string cannot be empty")
+                digests += _hash_bytes(input_string.encode('utf-8'), algorithm)
+        
+        # digest % 2^32 is the last 4 bytes of each 16-byte digest (big-endian)
+        if NUMPY_AVAILABLE:
+            words = np.frombuffer(bytes(digests), dtype='>u4').reshape(-1, 4)
+            return words[:, 3].astype(np.uint32)
+        return [
+            int.from_bytes(digests[i + 12:i + 16], 'big')
+            for i in range(0, len(digests), 16)
+        ]
     
     def set_seed(
         self, 
@@ -135,88 +541,21 @@ class SeedHashGenerator:
             >>> gen.set_seed("torch")  # Seed PyTorch
             >>> gen.set_seed("all")    # Seed all available frameworks
         """
-        valid_frameworks = ["torch", "tensorflow", "numpy", "all", "python"]
-        if framework not in valid_frameworks:
+        if framework not in _FRAMEWORK_GROUPS:
             raise ValueError(
                 f"Invalid framework '{framework}'. "
-                f"Must be one of: {valid_frameworks}"
+                f"Must be one of: {list(_FRAMEWORK_GROUPS)}"
             )
         
         status = {}
-        frameworks_to_seed = []
-        
-        # Determine which frameworks to seed
-        if framework == "all":
-            frameworks_to_seed = ["python", "numpy", "torch", "tensorflow"]
-        elif framework == "python":
-            frameworks_to_seed = ["python"]
-        else:
-            frameworks_to_seed = ["python", framework]
-        
-        # Seed Python's random module (always)
-        if "python" in frameworks_to_seed:
-            random.seed(self.seed_number)
-            status["python"] = "seeded"
-        
-        # Seed NumPy
-        if "numpy" in frameworks_to_seed:
-            if NUMPY_AVAILABLE:
-                np.random.seed(self.seed_number)
-                status["numpy"] = "seeded"
-            elif framework == "numpy":
-                raise ImportError(
-                    "NumPy is not installed. Install it with: pip install numpy"
-                )
-            else:
-                status["numpy"] = "not_available"
-        
-        # Seed PyTorch
-        if "torch" in frameworks_to_seed:
-            if TORCH_AVAILABLE:
-                torch.manual_seed(self.seed_number)
-                
-                # Seed CUDA if available
-                if torch.cuda.is_available():
-                    torch.cuda.manual_seed(self.seed_number)
-                    torch.cuda.manual_seed_all(self.seed_number)
-                
-                # Enable deterministic mode if requested
-                if deterministic:
-                    # Set deterministic algorithms
-                    torch.use_deterministic_algorithms(True, warn_only=True)
-                    
-                    # Set CUDNN to deterministic mode
-                    torch.backends.cudnn.deterministic = True
-                    torch.backends.cudnn.benchmark = False
-                    
-                    # Set environment variables for CUBLAS
-                    os.environ['CUBLAS_WORKSPACE_CONFIG'] = ':4096:8'
-                
-                status["torch"] = "seeded" + ("_deterministic" if deterministic else "")
-            elif framework == "torch":
-                raise ImportError(
-                    "PyTorch is not installed. Install it with: pip install torch"
-                )
-            else:
-                status["torch"] = "not_available"
-        
-        # Seed TensorFlow
-        if "tensorflow" in frameworks_to_seed:
-            if TF_AVAILABLE:
-                tf.random.set_seed(self.seed_number)
-                
-                # Set deterministic operations if requested
-                if deterministic:
-                    os.environ['TF_DETERMINISTIC_OPS'] = '1'
-                    os.environ['TF_CUDNN_DETERMINISTIC'] = '1'
-                
-                status["tensorflow"] = "seeded" + ("_deterministic" if deterministic else "")
-            elif framework == "tensorflow":
-                raise ImportError(
-                    "TensorFlow is not installed. Install it with: pip install tensorflow"
-                )
-            else:
-                status["tensorflow"] = "not_available"
+        for name in _FRAMEWORK_GROUPS[framework]:
+            result = _SEEDERS[name](self.seed_number, deterministic)
+            if result is None:
+                # Missing frameworks are only an error when requested explicitly
+                if name == framework:
+                    raise ImportError(_INSTALL_HINTS[name])
+                result = "not_available"
+            status[name] = result
         
         return status
     
@@ -249,32 +588,157 @@ class SeedHashGenerator:
             ValueError: If count is not a positive integer.
             TypeError: If count is not an integer.
         """
+        self._check_count(count)
+        
+        # Use a private Random instance so the global random state is untouched
+        # (discarded afterwards, so it need not be fast-forwarded past a batch)
+        rng = random.Random(self.seed_number)
+        
+        return _randint_seeds(
+            rng, self.min_value, self.max_value, count, advance_rng=False
+        )
+    
+    def generate_seeds_array(self, count: int) -> "np.ndarray":
+        """Generate random seed numbers as a NumPy array.
+        
+        Returns the same values as generate_seeds(count) without building an
+        intermediate Python list.
+        
+        Args:
+            count: The number of random seeds to generate.
+        
+        Returns:
+            An int64 array (object dtype if the range exceeds int64).
+        
+        Raises:
+            ValueError: If count is not a positive integer.
+            TypeError: If count is not an integer.
+            ImportError: If NumPy is not installed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "NumPy is not installed. Install it with: pip install numpy"
+            )
+        self._check_count(count)
+        
+        seeds = _randint_batch(
+            random.Random(self.seed_number), self.min_value, self.max_value, count,
+            advance_rng=False
+        )
+        if seeds is None:
+            seeds = np.array(self.generate_seeds(count), dtype=object)
+        return seeds
+    
+    def generate_seeds_fast(self, count: int) -> List[int]:
+        """Generate seeds from a SHAKE-256 stream keyed by the input string.
+        
+        This is a different sequence from generate_seeds (not MT19937-based),
+        so use it where seeds only need to be deterministic, not identical to
+        generate_seeds. The whole stream comes from one extendable-output
+        hash call. It is cut into little-endian words that are reduced into
+        [min_value, max_value] by modulo. Words carry at least 32 bits more
+        than the range needs, so the modulo bias stays below 2^-32.
+        
+        Args:
+            count: The number of random seeds to generate.
+        
+        Returns:
+            A list of random integers within the specified range.
+        
+        Raises:
+            ValueError: If count is not a positive integer.
+            TypeError: If count is not an integer.
+        """
+        self._check_count(count)
+        
+        lo = self.min_value
+        span = self.max_value - lo + 1
+        word_bytes = max(8, (span.bit_length() + 7) // 8 + 4)
+        raw = hashlib.shake_256(self.input_string.encode('utf-8')).digest(word_bytes * count)
+        
+        if NUMPY_AVAILABLE and word_bytes == 8 and lo >= -2**63 and self.max_value < 2**63:
+            words = np.frombuffer(raw, dtype='<u8')
+            # Wrapping int64 arithmetic is exact because every result fits in int64
+            return ((words % np.uint64(span)).view(np.int64) + np.int64(lo)).tolist()
+        return [
+            lo + int.from_bytes(raw[i:i + word_bytes], 'little') % span
+            for i in range(0, word_bytes * count, word_bytes)
+        ]
+    
+    @staticmethod
+    def _check_count(count: int) -> None:
+        """Validate the count argument of the generate_seeds* methods."""
         if not isinstance(count, int):
             raise TypeError("count must be an integer")
         
         if count <= 0:
             raise ValueError("count must be a positive integer")
+    
+    def derive_seed(self, index: int) -> int:
+        """Derive the index-th independent 32-bit seed from the input string.
         
-        # Set the random seed
-        random.seed(self.seed_number)
+        Uses BLAKE2b as a keyed PRF over the input string with the index as
+        salt, so any seed in the stream can be computed directly without
+        drawing the ones before it (e.g. one seed per worker or fold).
+        Independent of the generator's algorithm and range settings.
         
-        # Generate random numbers
-        random_numbers = [
-            random.randint(self.min_value, self.max_value) 
-            for _ in range(count)
-        ]
+        Args:
+            index: Position in the derived seed stream (0 <= index < 2^64).
+        
+        Returns:
+            An integer seed in [0, 2^32).
         
-        return random_numbers
+        Raises:
+            TypeError: If index is not an integer.
+            ValueError: If index is negative or does not fit in 64 bits.
+        
+        Example:
+            >>> gen = SeedHashGenerator("experiment_1")
+            >>> worker_seeds = [gen.derive_seed(rank) for rank in range(4)]
+        """
+        if not isinstance(index, int):
+            raise TypeError("index must be an integer")
+        if not 0 <= index < 2**64:
+            raise ValueError("index must be in the range [0, 2^64)")
+        
+        digest = hashlib.blake2b(
+            self.input_string.encode('utf-8'),
+            digest_size=4,
+            salt=index.to_bytes(8, 'little'),
+        ).digest()
+        return int.from_bytes(digest, 'little')
+    
+    def get_numpy_generator(self) -> "np.random.Generator":
+        """Create a NumPy Generator (PCG64) seeded from the hash-derived seed.
+        
+        The seed number is used as SeedSequence entropy, so the stream is
+        reproducible from the input string alone and independent of the
+        global NumPy and Python random states.
+        
+        Returns:
+            A new numpy.random.Generator.
+        
+        Raises:
+            ImportError: If NumPy is not installed.
+        
+        Example:
+            >>> gen = SeedHashGenerator("experiment_1")
+            >>> rng = gen.get_numpy_generator()
+            >>> noise = rng.normal(size=1000)
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "NumPy is not installed. Install it with: pip install numpy"
+            )
+        return np.random.default_rng(self.seed_number)
     
     def get_hash(self) -> str:
-        """Get the MD5 hash of the input string.
+        """Get the hash of the input string (MD5 unless another algorithm was chosen).
         
         Returns:
-            The MD5 hash as a hexadecimal string.
+            The hash as a hexadecimal string.
         """
-        md5_hasher = hashlib.md5()
-        md5_hasher.update(self.input_string.encode('utf-8'))
-        return md5_hasher.hexdigest()
+        return self._digest().hex()
     
     def __repr__(self) -> str:
         """Return a string representation of the generator."""
@@ -283,3 +747,46 @@ class SeedHashGenerator:
             f"min_value={self.min_value}, max_value={self.max_value}, "
             f"seed_number={self.seed_number})"
         )
+
+
+# slots=True needs Python 3.10+; older versions fall back to a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenSeedHash:
+    """Immutable, hashable seed specification.
+    
+    Holds the same inputs as SeedHashGenerator and the derived seed_number,
+    but is frozen, so instances can serve as dict keys, e.g. to memoize the
+    seed arrays generated for each configuration of a parameter sweep.
+    Equality and hashing use the inputs only.
+    
+    Example:
+        >>> cache = {}
+        >>> spec = FrozenSeedHash("experiment_1", 0, 1000)
+        >>> seeds = cache.setdefault(spec, spec.generate_seeds(10))
+    """
+    
+    input_string: str
+    min_value: int = SeedHashGenerator.DEFAULT_MIN
+    max_value: int = SeedHashGenerator.DEFAULT_MAX
+    algorithm: HashAlgorithm = "md5"
+    seed_number: int = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        """Validate the inputs and derive seed_number."""
+        generator = SeedHashGenerator(
+            self.input_string, self.min_value, self.max_value, self.algorithm
+        )
+        object.__setattr__(self, "seed_number", generator.seed_number)
+    
+    def to_generator(self) -> SeedHashGenerator:
+        """Return an equivalent SeedHashGenerator (inputs were validated at creation)."""
+        return SeedHashGenerator.unchecked(
+            self.input_string, self.min_value, self.max_value, self.algorithm
+        )
+    
+    def generate_seeds(self, count: int) -> List[int]:
+        """Same as SeedHashGenerator.generate_seeds for these inputs."""
+        return self.to_generator().generate_seeds(count)
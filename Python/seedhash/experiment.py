@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import copy
 import random
-from typing import List, Dict, Optional, Literal, Union, Any
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+from typing import List, Dict, Optional, Literal, Union, Any, Tuple, Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 import warnings
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+# pandas is only needed once results are turned into a DataFrame, so it is
+# looked up here but imported lazily by the methods that use it.
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+if not PANDAS_AVAILABLE:
     warnings.warn(
         "pandas is not installed. Install with: pip install pandas\n"
         "Experiment tracking requires pandas for DataFrame output."
@@ -24,7 +30,7 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
-from .core import SeedHashGenerator
+from .core import SeedHashGenerator, _randint_batch, _randint_loop, _randint_seeds
 
 
 SamplingMethod = Literal["simple", "stratified", "cluster", "systematic"]
@@ -82,11 +88,29 @@ class SeedSampler:
         self.master_seed = master_seed
         self.rng = random.Random(master_seed)
     
+    def method(self, sampling_method: SamplingMethod) -> Callable[..., List[int]]:
+        """Return the bound sampling function for a sampling method name.
+        
+        Args:
+            sampling_method: One of "simple", "stratified", "cluster", "systematic".
+        
+        Returns:
+            The matching ``*_random_sampling`` method of this sampler.
+        """
+        try:
+            return _SAMPLING_METHODS[sampling_method].__get__(self)
+        except KeyError:
+            raise ValueError(
+                f"Invalid sampling method '{sampling_method}'. "
+                f"Must be one of: {list(_SAMPLING_METHODS)}"
+            ) from None
+    
     def simple_random_sampling(
         self, 
         n_samples: int,
-        seed_range: tuple = (0, 2**31 - 1)
-    ) -> List[int]:
+        seed_range: tuple = (0, 2**31 - 1),
+        as_array: bool = False
+    ) -> Union[List[int], "np.ndarray"]:
         """Simple random sampling: Each seed has equal probability.
         
         Pure random selection without any structure or stratification.
@@ -95,12 +119,30 @@ class SeedSampler:
         Args:
             n_samples: Number of seeds to generate.
             seed_range: (min, max) range for generated seeds.
+            as_array: Return an int64 NumPy array instead of a list.
         
         Returns:
-            List of randomly generated seeds.
+            List (or array) of randomly generated seeds.
         """
         self.rng.seed(self.master_seed)
-        return [self.rng.randint(*seed_range) for _ in range(n_samples)]
+        min_seed, max_seed = seed_range
+        
+        # Same values as rng.randint in a loop; large batches are drawn in C
+        if as_array:
+            if not NUMPY_AVAILABLE:
+                raise ImportError(
+                    "NumPy is not installed. Install it with: pip install numpy"
+                )
+            seeds = _randint_batch(self.rng, min_seed, max_seed, n_samples)
+            if seeds is None:
+                # Empty request, or a range too wide for int64
+                fits = -2**63 <= min_seed and max_seed < 2**63
+                seeds = np.array(
+                    _randint_loop(self.rng, min_seed, max_seed, n_samples),
+                    dtype=np.int64 if fits else object
+                )
+            return seeds
+        return _randint_seeds(self.rng, min_seed, max_seed, n_samples)
     
     def stratified_random_sampling(
         self,
@@ -136,8 +178,8 @@ class SeedSampler:
             # Add extra sample to first strata if there's a remainder
             n_samples_this_stratum = samples_per_stratum + (1 if stratum_idx < remainder else 0)
             
-            for _ in range(n_samples_this_stratum):
-                seeds.append(self.rng.randint(stratum_min, stratum_max))
+            # One exact batched draw per stratum (same stream as per-seed randint)
+            seeds.extend(_randint_seeds(self.rng, stratum_min, stratum_max, n_samples_this_stratum))
         
         return seeds
     
@@ -184,23 +226,23 @@ class SeedSampler:
             else:
                 samples_this_cluster = min(samples_per_cluster, samples_remaining)
             
-            # Generate seeds around the center
-            for _ in range(samples_this_cluster):
-                offset = self.rng.randint(-cluster_radius, cluster_radius)
-                seed = max(min_seed, min(max_seed, center + offset))
-                seeds.append(seed)
-                samples_remaining -= 1
-                
-                if samples_remaining == 0:
-                    return seeds
+            # Generate seeds around the center: draw the cluster's offsets in
+            # one call, then clamp to the seed range
+            offsets = _randint_seeds(self.rng, -cluster_radius, cluster_radius, samples_this_cluster)
+            seeds.extend([max(min_seed, min(max_seed, center + offset)) for offset in offsets])
+            samples_remaining -= samples_this_cluster
+            
+            if samples_this_cluster and samples_remaining == 0:
+                return seeds
         
         return seeds
     
     def systematic_random_sampling(
         self,
         n_samples: int,
-        seed_range: tuple = (0, 2**31 - 1)
-    ) -> List[int]:
+        seed_range: tuple = (0, 2**31 - 1),
+        as_array: bool = False
+    ) -> Union[List[int], "np.ndarray"]:
         """Systematic random sampling: Select seeds at regular intervals.
         
         Picks a random starting point, then selects every k-th seed.
@@ -209,9 +251,10 @@ class SeedSampler:
         Args:
             n_samples: Number of seeds to generate.
             seed_range: (min, max) range for generated seeds.
+            as_array: Return an int64 NumPy array instead of a list.
         
         Returns:
-            List of systematically sampled seeds at regular intervals.
+            List (or array) of systematically sampled seeds at regular intervals.
         """
         self.rng.seed(self.master_seed)
         
@@ -221,16 +264,117 @@ class SeedSampler:
         # Random starting point within first interval
         start = self.rng.randint(min_seed, min(min_seed + interval, max_seed))
         
-        seeds = []
-        for i in range(n_samples):
-            seed = start + (i * interval)
-            if seed <= max_seed:
-                seeds.append(seed)
-            else:
-                # Wrap around if needed
-                seeds.append(min_seed + (seed - max_seed))
-        
-        return seeds
+        # Seeds past max_seed wrap around to the start of the range
+        wrap = min_seed - max_seed
+        if as_array:
+            if not NUMPY_AVAILABLE:
+                raise ImportError(
+                    "NumPy is not installed. Install it with: pip install numpy"
+                )
+            if -2**63 <= min_seed and max_seed < 2**63:
+                # start <= min_seed + interval, so the last seed is at most
+                # min_seed + n_samples * interval <= max_seed: nothing wraps
+                return start + np.arange(n_samples, dtype=np.int64) * interval
+        seeds = [
+            seed if seed <= max_seed else seed + wrap
+            for seed in (start + i * interval for i in range(n_samples))
+        ]
+        return np.array(seeds, dtype=object) if as_array else seeds
+
+
+# Sampling method name -> SeedSampler implementation, shared by every sampler
+_SAMPLING_METHODS: Dict[str, Callable[..., List[int]]] = {
+    "simple": SeedSampler.simple_random_sampling,
+    "stratified": SeedSampler.stratified_random_sampling,
+    "cluster": SeedSampler.cluster_random_sampling,
+    "systematic": SeedSampler.systematic_random_sampling,
+}
+
+
+# Per-level (parent_seed, child_seeds) groups of a generated hierarchy
+HierarchyLevels = Tuple[Tuple[Tuple[int, Tuple[int, ...]], ...], ...]
+
+
+@functools.lru_cache(maxsize=128)
+def _build_seed_hierarchy(
+    master_seed: int,
+    n_seeds: int,
+    n_sub_seeds: int,
+    max_depth: int,
+    sampling_method: str,
+    seed_range: Tuple[int, int]
+) -> HierarchyLevels:
+    """Sample every level of a seed hierarchy (memoized, output is deterministic)."""
+    levels = []
+    parents: Tuple[int, ...] = (master_seed,)
+    
+    # One sampler is reused for every parent: each sampling method starts by
+    # seeding its Random from sampler.master_seed, which leaves it in the same
+    # state as a fresh SeedSampler(parent) without the allocations
+    sampler = SeedSampler(master_seed)
+    sampling_func = sampler.method(sampling_method)
+    
+    for depth in range(1, max_depth + 1):
+        n_samples = n_seeds if depth == 1 else n_sub_seeds
+        groups = []
+        for parent_seed in parents:
+            sampler.master_seed = parent_seed
+            groups.append((parent_seed, tuple(sampling_func(n_samples, seed_range))))
+        
+        levels.append(tuple(groups))
+        parents = tuple(child for _, children in groups for child in children)
+    
+    return tuple(levels)
+
+
+# Part of every on-disk hierarchy cache key; bump it whenever hierarchy
+# generation or the cache file format changes so stale files are never served
+_HIERARCHY_CACHE_VERSION = 1
+
+
+def _load_seed_hierarchy(cache_dir: str, key_params: list) -> HierarchyLevels:
+    """Load a hierarchy from the on-disk cache, generating and saving it on a miss."""
+    key_data = json.dumps([_HIERARCHY_CACHE_VERSION] + key_params)
+    key = hashlib.md5(key_data.encode('utf-8')).hexdigest()
+    path = os.path.join(cache_dir, f"hierarchy_{key}.json")
+    
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return tuple(
+                tuple((parent, tuple(children)) for parent, children in level)
+                for level in json.load(f)
+            )
+    
+    levels = _build_seed_hierarchy(*key_params[:5], tuple(key_params[5]))
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(levels, f)
+    os.replace(tmp_path, path)
+    
+    return levels
+
+
+def _compact_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Convert a results DataFrame's bookkeeping columns to compact dtypes."""
+    import pandas as pd
+    
+    dtypes = {}
+    for col in ('sampling_method', 'ml_task'):
+        if col in df:
+            dtypes[col] = 'category'
+    for col in ('seed', 'sub_seed'):
+        if col in df:
+            # Nullable, so rows without a seed/sub_seed keep integer seeds
+            # instead of falling back to float64
+            dtypes[col] = 'Int64'
+    if importlib.util.find_spec("pyarrow") is not None:
+        dtypes['experiment_id'] = 'string[pyarrow]'
+    
+    df = df.astype(dtypes)
+    df['seed_level'] = pd.to_numeric(df['seed_level'], downcast='integer')
+    return df
 
 
 class SeedExperimentManager:
@@ -255,26 +399,83 @@ class SeedExperimentManager:
     def __init__(
         self,
         experiment_name: str,
-        master_seed: Optional[int] = None
+        master_seed: Optional[int] = None,
+        hash_algorithm: str = "md5",
+        metric_dtype: Optional[str] = None,
+        compact_dtypes: bool = False
     ):
         """Initialize the experiment manager.
         
         Args:
             experiment_name: Name of the experiment (used to generate master seed).
             master_seed: Optional master seed (generated from name if not provided).
+            hash_algorithm: Hash algorithm used to derive the master seed
+                ("md5", "blake2b" or "blake3", see SeedHashGenerator).
+            metric_dtype: Optional dtype for the metric_* DataFrame columns,
+                e.g. "float32" to halve their memory for large runs. Default
+                keeps pandas' inferred dtypes (float64 for float metrics).
+            compact_dtypes: Store sampling_method/ml_task as categoricals,
+                seed/sub_seed as nullable Int64 and seed_level as the smallest
+                integer type in the results DataFrame. Cuts memory and speeds
+                up value_counts/groupby for large runs. Off by default.
         """
         self.experiment_name = experiment_name
+        self.metric_dtype = metric_dtype
+        self.compact_dtypes = compact_dtypes
         
         if master_seed is None:
             # Generate master seed from experiment name
-            gen = SeedHashGenerator(experiment_name)
+            gen = SeedHashGenerator(experiment_name, algorithm=hash_algorithm)
             self.master_seed = gen.seed_number
         else:
             self.master_seed = master_seed
         
         self.sampler = SeedSampler(self.master_seed)
-        self.results: List[ExperimentResult] = []
+        self._results: List[ExperimentResult] = []
         self._seed_hierarchy: Dict[int, Dict] = {}
+        
+        # Batches added by add_experiment_results_columns, which only write the
+        # column store; their ExperimentResult objects are built on first access
+        # to self.results
+        self._pending_batches: List[tuple] = []
+        self._pending_rows = 0
+        
+        # Column-oriented copy of self.results (column name -> values), filled
+        # by add_experiment_result so DataFrames are built from typed columns
+        self._columns: Dict[str, List[Any]] = {}
+        self._column_rows = 0
+        
+        # Cached DataFrame/summary, rebuilt only after new results are added
+        self._results_version = 0
+        self._df_cache = None
+        self._df_key = None
+        self._summary_cache: Dict = {}
+        self._summary_key = None
+    
+    @property
+    def results(self) -> List[ExperimentResult]:
+        """All recorded experiment results, in the order they were added.
+        
+        The DataFrame and summary are cached until results are added or this
+        list is replaced. After changing an entry in place (e.g. its metrics),
+        call invalidate_cache() so they are rebuilt.
+        """
+        if self._pending_batches:
+            for batch in self._pending_batches:
+                self._results.extend(self._batch_results(*batch))
+            self._pending_batches = []
+            self._pending_rows = 0
+        return self._results
+    
+    @results.setter
+    def results(self, results: List[ExperimentResult]) -> None:
+        self._results = results
+        self._pending_batches = []
+        self._pending_rows = 0
+        # Resynced from the new list by get_results_dataframe
+        self._columns = {}
+        self._column_rows = 0
+        self._results_version += 1
     
     def generate_seed_hierarchy(
         self,
@@ -282,54 +483,184 @@ class SeedExperimentManager:
         n_sub_seeds: int = 5,
         max_depth: int = 2,
         sampling_method: SamplingMethod = "simple",
-        seed_range: tuple = (0, 2**31 - 1)
+        seed_range: tuple = (0, 2**31 - 1),
+        cache_dir: Optional[str] = None
     ) -> Dict[int, List[int]]:
         """Generate hierarchical seed structure: master → seeds → sub_seeds → ...
         
+        Hierarchies are deterministic, so they are memoized in-process and can
+        optionally be persisted to disk to skip regeneration across runs.
+        
         Args:
             n_seeds: Number of seeds to generate from master seed.
             n_sub_seeds: Number of sub-seeds to generate from each seed.
             max_depth: Maximum depth of hierarchy (1=seeds only, 2=sub_seeds, etc.).
             sampling_method: Which sampling method to use.
             seed_range: (min, max) range for generated seeds.
+            cache_dir: Optional directory for an on-disk JSON cache of generated
+                hierarchies (e.g. "~/.cache/seedhash"). Disabled by default.
         
         Returns:
             Dictionary mapping level to list of seeds at that level.
         """
-        sampling_func = getattr(self.sampler, f"{sampling_method}_random_sampling")
+        # Fail early on an unknown sampling method
+        self.sampler.method(sampling_method)
+        
+        seed_range = tuple(seed_range)
+        if cache_dir is not None:
+            levels = _load_seed_hierarchy(
+                os.path.expanduser(cache_dir),
+                [self.master_seed, n_seeds, n_sub_seeds, max_depth,
+                 sampling_method, list(seed_range)]
+            )
+        else:
+            levels = _build_seed_hierarchy(
+                self.master_seed, n_seeds, n_sub_seeds, max_depth,
+                sampling_method, seed_range
+            )
         
         hierarchy = {0: [self.master_seed]}
         
-        for depth in range(1, max_depth + 1):
+        for depth, groups in enumerate(levels, start=1):
             current_level_seeds = []
+            
+            for parent_seed, child_seeds in groups:
+                child_seeds = list(child_seeds)
+                current_level_seeds.extend(child_seeds)
+                self._track_children(parent_seed, child_seeds, depth)
+            
+            hierarchy[depth] = current_level_seeds
+        
+        return hierarchy
+    
+    def generate_leaf_seeds(
+        self,
+        n_leaves: int,
+        n_seeds: int = 10,
+        n_sub_seeds: int = 5,
+        max_depth: int = 2,
+        sampling_method: SamplingMethod = "simple",
+        seed_range: tuple = (0, 2**31 - 1)
+    ) -> List[int]:
+        """Generate only the first leaf seeds of a hierarchy.
+        
+        Returns the same seeds as
+        ``generate_seed_hierarchy(...)[max_depth][:n_leaves]`` (and records the
+        same parent links), but only expands the parents needed to reach
+        ``n_leaves`` seeds instead of building every level in full.
+        
+        Args:
+            n_leaves: Number of leaf seeds to return.
+            n_seeds: Number of seeds to generate from master seed.
+            n_sub_seeds: Number of sub-seeds to generate from each seed.
+            max_depth: Depth of the leaf level (1=seeds, 2=sub_seeds, etc.).
+            sampling_method: Which sampling method to use.
+            seed_range: (min, max) range for generated seeds.
+        
+        Returns:
+            List of at most n_leaves seeds from level max_depth.
+        """
+        # Fail early on an unknown sampling method
+        self.sampler.method(sampling_method)
+        
+        def expand(parents, depth):
+            n_samples = n_seeds if depth == 1 else n_sub_seeds
+            # Each level's generator owns one sampler, pointed at each parent
+            # in turn (sampling methods seed from sampler.master_seed)
+            sampler = SeedSampler(self.master_seed)
+            sampling_func = sampler.method(sampling_method)
+            for parent_seed in parents:
+                sampler.master_seed = parent_seed
+                child_seeds = sampling_func(n_samples, seed_range)
+                self._track_children(parent_seed, child_seeds, depth)
+                yield from child_seeds
+        
+        # Chain lazy level generators so parents are expanded on demand
+        seeds = iter([self.master_seed])
+        for depth in range(1, max_depth + 1):
+            seeds = expand(seeds, depth)
+        
+        return list(itertools.islice(seeds, n_leaves))
+    
+    def spawn_seed_hierarchy(
+        self,
+        n_seeds: int = 10,
+        n_sub_seeds: int = 5,
+        max_depth: int = 2,
+        seed_range: tuple = (0, 2**31 - 1)
+    ) -> Dict[int, List[int]]:
+        """Generate a seed hierarchy from NumPy SeedSequence.spawn() trees.
+        
+        Each node's children come from spawning its SeedSequence, so child
+        streams are statistically independent without reseeding a Random per
+        parent. Seeds are reproducible from the master seed but do NOT match
+        generate_seed_hierarchy(); use that method when seeds must agree with
+        previously published runs or the R package.
+        
+        Args:
+            n_seeds: Number of seeds to generate from master seed.
+            n_sub_seeds: Number of sub-seeds to generate from each seed.
+            max_depth: Maximum depth of hierarchy (1=seeds only, 2=sub_seeds, etc.).
+            seed_range: (min, max) range for generated seeds.
+        
+        Returns:
+            Dictionary mapping level to list of seeds at that level.
+        
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for spawn_seed_hierarchy")
+        
+        min_seed, max_seed = seed_range
+        span = max_seed - min_seed + 1
+        
+        hierarchy = {0: [self.master_seed]}
+        parents = [(self.master_seed, np.random.SeedSequence(self.master_seed))]
+        
+        for depth in range(1, max_depth + 1):
             n_samples = n_seeds if depth == 1 else n_sub_seeds
+            current_level_seeds = []
+            next_parents = []
             
-            for parent_seed in hierarchy[depth - 1]:
-                # Create new sampler for this parent
-                sampler = SeedSampler(parent_seed)
-                sampling_func_local = getattr(sampler, f"{sampling_method}_random_sampling")
-                
-                # Generate child seeds
-                child_seeds = sampling_func_local(n_samples, seed_range)
+            for parent_seed, parent_ss in parents:
+                children = parent_ss.spawn(n_samples)
+                # 64 well-mixed bits per child; modulo bias is negligible
+                child_seeds = [
+                    min_seed + int(child.generate_state(1, dtype=np.uint64)[0]) % span
+                    for child in children
+                ]
+                self._track_children(parent_seed, child_seeds, depth)
                 current_level_seeds.extend(child_seeds)
-                
-                # Track hierarchy
-                if parent_seed not in self._seed_hierarchy:
-                    self._seed_hierarchy[parent_seed] = {'children': [], 'level': depth - 1}
-                
-                # Ensure 'children' key exists
-                if 'children' not in self._seed_hierarchy[parent_seed]:
-                    self._seed_hierarchy[parent_seed]['children'] = []
-                    
-                self._seed_hierarchy[parent_seed]['children'].extend(child_seeds)
-                
-                for child in child_seeds:
-                    self._seed_hierarchy[child] = {'parent': parent_seed, 'level': depth}
+                next_parents.extend(zip(child_seeds, children))
             
             hierarchy[depth] = current_level_seeds
+            parents = next_parents
         
         return hierarchy
     
+    def _track_children(self, parent_seed: int, child_seeds: List[int], depth: int) -> None:
+        """Record parent/child links used to reconstruct a result's seed hierarchy."""
+        if parent_seed not in self._seed_hierarchy:
+            self._seed_hierarchy[parent_seed] = {'children': [], 'level': depth - 1}
+        
+        # Ensure 'children' key exists
+        if 'children' not in self._seed_hierarchy[parent_seed]:
+            self._seed_hierarchy[parent_seed]['children'] = []
+            
+        self._seed_hierarchy[parent_seed]['children'].extend(child_seeds)
+        
+        # Memoize each child's full ancestor chain (master first) on its entry
+        # so results resolve their hierarchy without walking parent links
+        prefix = self._seed_hierarchy[parent_seed].get('ancestors')
+        if prefix is None:
+            prefix = (parent_seed,) if parent_seed == self.master_seed else (self.master_seed, parent_seed)
+        
+        for child in child_seeds:
+            self._seed_hierarchy[child] = {
+                'parent': parent_seed, 'level': depth, 'ancestors': prefix + (child,)
+            }
+    
     def add_experiment_result(
         self,
         seed: int,
@@ -347,22 +678,143 @@ class SeedExperimentManager:
             sampling_method: Sampling method used to generate this seed.
             metadata: Optional additional information.
         """
-        # Reconstruct seed hierarchy
-        hierarchy = [seed]
-        current = seed
-        while current in self._seed_hierarchy and 'parent' in self._seed_hierarchy[current]:
-            parent = self._seed_hierarchy[current]['parent']
-            hierarchy.insert(0, parent)
-            current = parent
-        
-        # Add master seed if not present
-        if not hierarchy or hierarchy[0] != self.master_seed:
-            hierarchy.insert(0, self.master_seed)
+        result = self._make_result(seed, ml_task, metrics, sampling_method, metadata)
+        
+        self.results.append(result)
+        self._append_columns(result)
+        self._results_version += 1
+    
+    def add_experiment_results_bulk(
+        self,
+        records: List[Tuple[int, Dict[str, float], SamplingMethod, Optional[Dict[str, Any]]]],
+        ml_task: MLTask
+    ) -> None:
+        """Add several results for the same ML task in one call.
         
+        Equivalent to calling add_experiment_result once per record, but the
+        results list is extended once and the DataFrame caches are
+        invalidated once.
+        
+        Args:
+            records: (seed, metrics, sampling_method, metadata) tuples.
+            ml_task: Type of ML task shared by all records.
+        """
+        new_results = [
+            self._make_result(seed, ml_task, metrics, sampling_method, metadata)
+            for seed, metrics, sampling_method, metadata in records
+        ]
+        if not new_results:
+            return
+        
+        self.results.extend(new_results)
+        for result in new_results:
+            self._append_columns(result)
+        self._results_version += 1
+    
+    def add_experiment_results_columns(
+        self,
+        seeds: Sequence[int],
+        ml_task: MLTask,
+        metrics: Dict[str, Sequence[float]],
+        sampling_method: SamplingMethod,
+        metadata: Optional[Dict[str, Sequence[Any]]] = None
+    ) -> None:
+        """Add a batch of results given as columns (one value per seed).
+        
+        Produces the same rows as calling add_experiment_result once per seed,
+        but values are appended straight to the column store, the batch shares
+        one timestamp, and ExperimentResult objects are only built if
+        ``results`` is read.
+        
+        Args:
+            seeds: Seeds used for the experiments.
+            ml_task: Type of ML task shared by the batch.
+            metrics: Metric name -> sequence (or array) of values, one per seed.
+            sampling_method: Sampling method shared by the batch.
+            metadata: Optional metadata key -> sequence of values, one per seed.
+        """
+        seeds = seeds.tolist() if hasattr(seeds, 'tolist') else list(seeds)
+        n = len(seeds)
+        columns_in = {}
+        for prefix, values in (('metric_', metrics), ('meta_', metadata or {})):
+            for key, column in values.items():
+                column = column.tolist() if hasattr(column, 'tolist') else list(column)
+                if len(column) != n:
+                    raise ValueError(
+                        f"'{key}' has {len(column)} values but {n} seeds were given"
+                    )
+                columns_in[prefix + key] = column
+        if n == 0:
+            return
+        
+        hierarchies = [self._ancestors(seed) for seed in seeds]
+        timestamp = datetime.now().isoformat()
+        
+        block = {
+            'experiment_id': [f"{self.experiment_name}_{ml_task}_seed{seed}" for seed in seeds],
+            'seed_level': [len(h) - 1 for h in hierarchies],
+            'master_seed': [h[0] for h in hierarchies],
+            'seed': [h[1] if len(h) > 1 else None for h in hierarchies],
+            'sub_seed': [h[2] if len(h) > 2 else None for h in hierarchies],
+            'current_seed': [h[-1] for h in hierarchies],
+            'sampling_method': [sampling_method] * n,
+            'ml_task': [ml_task] * n,
+            'timestamp': [timestamp] * n,
+        }
+        block.update(columns_in)
+        self._extend_columns(block, n)
+        
+        self._pending_batches.append((
+            block['experiment_id'], hierarchies, ml_task, sampling_method,
+            dict(metrics), dict(metadata or {}), columns_in, timestamp
+        ))
+        self._pending_rows += n
+        self._results_version += 1
+    
+    @staticmethod
+    def _batch_results(experiment_ids, hierarchies, ml_task, sampling_method,
+                       metrics, metadata, columns_in, timestamp) -> List[ExperimentResult]:
+        """Build the ExperimentResult objects of a columnar batch."""
+        metric_cols = [(key, columns_in['metric_' + key]) for key in metrics]
+        meta_cols = [(key, columns_in['meta_' + key]) for key in metadata]
+        return [
+            ExperimentResult(
+                experiment_id=experiment_id,
+                seed_hierarchy=list(hierarchy),
+                seed_level=len(hierarchy) - 1,
+                sampling_method=sampling_method,
+                ml_task=ml_task,
+                metrics={key: values[i] for key, values in metric_cols},
+                metadata={key: values[i] for key, values in meta_cols},
+                timestamp=timestamp
+            )
+            for i, (experiment_id, hierarchy) in enumerate(zip(experiment_ids, hierarchies))
+        ]
+    
+    def _ancestors(self, seed: int) -> Tuple[int, ...]:
+        """Return the seed's ancestor chain, master seed first and seed last."""
+        # Ancestor chains are memoized by _track_children
+        entry = self._seed_hierarchy.get(seed)
+        if entry is not None and 'ancestors' in entry:
+            return entry['ancestors']
+        if seed == self.master_seed:
+            return (seed,)
+        return (self.master_seed, seed)
+    
+    def _make_result(
+        self,
+        seed: int,
+        ml_task: MLTask,
+        metrics: Dict[str, float],
+        sampling_method: SamplingMethod,
+        metadata: Optional[Dict[str, Any]]
+    ) -> ExperimentResult:
+        """Build the ExperimentResult for a seed, resolving its ancestry."""
+        hierarchy = list(self._ancestors(seed))
         seed_level = len(hierarchy) - 1
         experiment_id = f"{self.experiment_name}_{ml_task}_seed{seed}"
         
-        result = ExperimentResult(
+        return ExperimentResult(
             experiment_id=experiment_id,
             seed_hierarchy=hierarchy,
             seed_level=seed_level,
@@ -371,39 +823,118 @@ class SeedExperimentManager:
             metrics=metrics,
             metadata=metadata or {}
         )
+    
+    def _append_columns(self, result: ExperimentResult) -> None:
+        """Append one result to the column store, padding missing values with NaN."""
+        row = result.to_dict()
+        n_rows = self._column_rows
         
-        self.results.append(result)
+        for key in row:
+            if key not in self._columns:
+                self._columns[key] = [float('nan')] * n_rows
+        
+        for key, column in self._columns.items():
+            column.append(row.get(key, float('nan')))
+        
+        self._column_rows += 1
+    
+    def _extend_columns(self, block: Dict[str, List[Any]], n: int) -> None:
+        """Append n rows given as columns to the column store, padding with NaN."""
+        n_rows = self._column_rows
+        
+        for key in block:
+            if key not in self._columns:
+                self._columns[key] = [float('nan')] * n_rows
+        
+        for key, column in self._columns.items():
+            column.extend(block[key] if key in block else [float('nan')] * n)
+        
+        self._column_rows += n
+    
+    def invalidate_cache(self) -> None:
+        """Rebuild the results DataFrame and summary on their next request.
+        
+        Needed only after modifying entries of self.results in place; adding
+        results or assigning a new list invalidates the caches automatically.
+        """
+        self._columns = {}
+        self._column_rows = 0
+        self._results_version += 1
+    
+    def _n_results(self) -> int:
+        """Number of recorded results, without building pending ones."""
+        return len(self._results) + self._pending_rows
+    
+    def _cache_key(self) -> tuple:
+        """Key identifying the current set of results for the DataFrame caches."""
+        return (self._results_version, self._n_results())
     
-    def get_results_dataframe(self) -> Union[pd.DataFrame, None]:
+    def get_results_dataframe(self) -> Optional["pd.DataFrame"]:
         """Get all experiment results as a pandas DataFrame.
         
+        The frame is built once and cached until new results are added; each
+        call returns a copy, so modifying it leaves later calls unaffected.
+        
         Returns:
             DataFrame with experiment results, or None if pandas not available.
         """
+        df = self._results_frame()
+        return None if df is None else df.copy()
+    
+    def _results_frame(self) -> Optional["pd.DataFrame"]:
+        """Return the cached results DataFrame, rebuilding it if stale.
+        
+        Internal callers only read the frame, so it is returned uncopied.
+        """
         if not PANDAS_AVAILABLE:
             warnings.warn("pandas is not installed. Cannot create DataFrame.")
             return None
         
-        if not self.results:
+        import pandas as pd
+        
+        if not self._n_results():
             warnings.warn("No results to convert to DataFrame.")
             return pd.DataFrame()
         
-        data = [result.to_dict() for result in self.results]
-        df = pd.DataFrame(data)
+        if self._df_key == self._cache_key():
+            return self._df_cache
+        
+        if self._column_rows != self._n_results():
+            # self.results was modified directly; rebuild the column store once
+            # so later calls take the columnar path again
+            self._columns = {}
+            self._column_rows = 0
+            for result in self.results:
+                self._append_columns(result)
+        columns = self._columns
         
-        # Reorder columns for better readability
+        # Order columns for better readability
         priority_cols = [
             'experiment_id', 'seed_level', 'master_seed', 'seed', 'sub_seed',
             'current_seed', 'sampling_method', 'ml_task'
         ]
         
-        existing_priority = [col for col in priority_cols if col in df.columns]
-        metric_cols = sorted([col for col in df.columns if col.startswith('metric_')])
-        meta_cols = sorted([col for col in df.columns if col.startswith('meta_')])
-        other_cols = [col for col in df.columns if col not in existing_priority + metric_cols + meta_cols]
+        existing_priority = [col for col in priority_cols if col in columns]
+        metric_cols = sorted([col for col in columns if col.startswith('metric_')])
+        meta_cols = sorted([col for col in columns if col.startswith('meta_')])
+        ordered = set(existing_priority + metric_cols + meta_cols)
+        other_cols = [col for col in columns if col not in ordered]
+        
+        # Build the frame in its final column order rather than reindexing
+        # (and copying) it afterwards
+        df = pd.DataFrame({
+            col: columns[col]
+            for col in existing_priority + metric_cols + meta_cols + other_cols
+        })
         
-        df = df[existing_priority + metric_cols + meta_cols + other_cols]
+        if self.metric_dtype is not None and metric_cols:
+            df = df.astype({col: self.metric_dtype for col in metric_cols})
         
+        if self.compact_dtypes:
+            df = _compact_frame(df)
+        
+        self._df_cache = df
+        self._df_key = self._cache_key()
         return df
     
     def get_summary_statistics(self) -> Dict:
@@ -412,13 +943,16 @@ class SeedExperimentManager:
         Returns:
             Dictionary with summary statistics.
         """
-        if not PANDAS_AVAILABLE or not self.results:
+        if not PANDAS_AVAILABLE or not self._n_results():
             return {}
         
-        df = self.get_results_dataframe()
+        if self._summary_key == self._cache_key():
+            return copy.deepcopy(self._summary_cache)
+        
+        df = self._results_frame()
         
         summary = {
-            'total_experiments': len(self.results),
+            'total_experiments': self._n_results(),
             'ml_tasks': df['ml_task'].value_counts().to_dict() if 'ml_task' in df else {},
             'sampling_methods': df['sampling_method'].value_counts().to_dict(),
             'seed_levels': df['seed_level'].value_counts().to_dict(),
@@ -427,38 +961,65 @@ class SeedExperimentManager:
         # Calculate metric statistics
         metric_cols = [col for col in df.columns if col.startswith('metric_')]
         if metric_cols:
-            summary['metric_statistics'] = {}
-            for col in metric_cols:
-                metric_name = col.replace('metric_', '')
-                summary['metric_statistics'][metric_name] = {
-                    'mean': float(df[col].mean()),
-                    'std': float(df[col].std()),
-                    'min': float(df[col].min()),
-                    'max': float(df[col].max())
+            # One aggregation call for every metric column and statistic
+            stats = df[metric_cols].agg(['mean', 'std', 'min', 'max'])
+            summary['metric_statistics'] = {
+                col.replace('metric_', ''): {
+                    stat: float(value) for stat, value in stats[col].items()
                 }
+                for col in metric_cols
+            }
         
-        return summary
+        self._summary_cache = summary
+        self._summary_key = self._cache_key()
+        return copy.deepcopy(summary)
     
-    def export_results(self, filepath: str, format: str = 'csv') -> None:
-        """Export results to a file.
+    def export_results(
+        self,
+        filepath: Union[str, List[str]],
+        format: Union[str, List[str]] = 'csv'
+    ) -> None:
+        """Export results to one or more files.
+        
+        The results DataFrame is built once and shared by every requested
+        format, so exporting several formats in one call costs a single
+        materialization.
         
         Args:
-            filepath: Path to save the results.
-            format: File format ('csv', 'json', 'excel').
+            filepath: Path (str or os.PathLike) to save the results, or a list
+                of paths (one per format).
+            format: File format ('csv', 'json', 'excel'), or a list of formats.
+        
+        Example:
+            >>> manager.export_results(['results.csv', 'results.json'],
+            ...                        format=['csv', 'json'])
         """
         if not PANDAS_AVAILABLE:
             raise ImportError("pandas is required for exporting results")
         
-        df = self.get_results_dataframe()
-        
-        if format == 'csv':
-            df.to_csv(filepath, index=False)
-        elif format == 'json':
-            df.to_json(filepath, orient='records', indent=2)
-        elif format == 'excel':
-            df.to_excel(filepath, index=False)
+        if isinstance(filepath, (str, os.PathLike)):
+            filepaths = [filepath]
         else:
-            raise ValueError(f"Unsupported format: {format}")
+            filepaths = list(filepath)
+        formats = [format] if isinstance(format, str) else list(format)
+        
+        if len(filepaths) != len(formats):
+            raise ValueError(
+                f"Got {len(filepaths)} file paths for {len(formats)} formats"
+            )
+        for fmt in formats:
+            if fmt not in ('csv', 'json', 'excel'):
+                raise ValueError(f"Unsupported format: {fmt}")
+        
+        df = self._results_frame()
+        
+        for path, fmt in zip(filepaths, formats):
+            if fmt == 'csv':
+                df.to_csv(path, index=False)
+            elif fmt == 'json':
+                df.to_json(path, orient='records', indent=2)
+            else:
+                df.to_excel(path, index=False)
 
 
 class MLMetrics:
@@ -478,20 +1039,28 @@ class MLMetrics:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        y_true = np.array(y_true)
-        y_pred = np.array(y_pred)
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
         
-        mse = np.mean((y_true - y_pred) ** 2)
+        # Residuals and their squares are computed once and shared
+        diff = y_true - y_pred
+        ss_res = np.sum(diff * diff)
+        mse = ss_res / diff.size
         rmse = np.sqrt(mse)
-        mae = np.mean(np.abs(y_true - y_pred))
+        mae = np.mean(np.abs(diff))
         
-        ss_res = np.sum((y_true - y_pred) ** 2)
-        ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+        dev = y_true - np.mean(y_true)
+        ss_tot = np.sum(dev * dev)
         r2 = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
         
         # Mean Absolute Percentage Error (avoid division by zero)
         mask = y_true != 0
-        mape = np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100 if np.any(mask) else 0
+        if mask.all():
+            mape = np.mean(np.abs(diff / y_true)) * 100
+        elif mask.any():
+            mape = np.mean(np.abs(diff[mask] / y_true[mask])) * 100
+        else:
+            mape = 0
         
         return {
             'rmse': float(rmse),
@@ -515,8 +1084,8 @@ class MLMetrics:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        y_true = np.array(y_true)
-        y_pred = np.array(y_pred)
+        y_true = np.asarray(y_true).reshape(-1)
+        y_pred = np.asarray(y_pred).reshape(-1)
         
         # Accuracy
         accuracy = np.mean(y_true == y_pred)
@@ -531,20 +1100,25 @@ class MLMetrics:
             recall = tp / (tp + fn) if (tp + fn) > 0 else 0
             f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
         else:
-            # Multi-class: use macro average
-            classes = np.unique(y_true)
-            precisions, recalls = [], []
+            # Multi-class: use macro average over the classes in y_true,
+            # read off one confusion matrix
+            both = np.concatenate([y_true, y_pred])
+            if both.dtype.kind in 'iu' and both.size and both.min() >= 0 and both.max() < 4096:
+                # Small non-negative integer labels index the matrix directly
+                codes, k = both.astype(np.intp), int(both.max()) + 1
+            else:
+                labels, codes = np.unique(both, return_inverse=True)
+                codes, k = codes.reshape(-1), len(labels)
+            true_codes, pred_codes = codes[:len(y_true)], codes[len(y_true):]
+            cm = np.bincount(true_codes * k + pred_codes, minlength=k * k).reshape(k, k)
             
-            for cls in classes:
-                tp = np.sum((y_true == cls) & (y_pred == cls))
-                fp = np.sum((y_true != cls) & (y_pred == cls))
-                fn = np.sum((y_true == cls) & (y_pred != cls))
-                
-                prec = tp / (tp + fp) if (tp + fp) > 0 else 0
-                rec = tp / (tp + fn) if (tp + fn) > 0 else 0
-                
-                precisions.append(prec)
-                recalls.append(rec)
+            actual = cm.sum(axis=1)
+            classes = actual > 0
+            tp = np.diag(cm)[classes]
+            predicted = cm.sum(axis=0)[classes]
+            actual = actual[classes]
+            precisions = np.divide(tp, predicted, out=np.zeros(len(tp)), where=predicted > 0)
+            recalls = np.divide(tp, actual, out=np.zeros(len(tp)), where=actual > 0)
             
             precision = np.mean(precisions)
             recall = np.mean(recalls)
@@ -571,40 +1145,40 @@ class MLMetrics:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        X = np.array(X)
-        labels = np.array(labels)
+        X = np.asarray(X)
+        labels = np.asarray(labels)
         
         # Simplified silhouette score calculation
         n_clusters = len(np.unique(labels))
         if n_clusters < 2 or n_clusters >= len(X):
             return {'silhouette': 0.0, 'davies_bouldin': float('inf')}
         
-        # Calculate intra-cluster distances (a)
-        a_values = []
-        for i in range(len(X)):
-            same_cluster = X[labels == labels[i]]
-            if len(same_cluster) > 1:
-                a = np.mean([np.linalg.norm(X[i] - x) for x in same_cluster if not np.array_equal(X[i], x)])
-            else:
-                a = 0
-            a_values.append(a)
-        
-        # Calculate nearest-cluster distances (b)
-        b_values = []
-        for i in range(len(X)):
-            min_b = float('inf')
-            for cluster in np.unique(labels):
-                if cluster != labels[i]:
-                    other_cluster = X[labels == cluster]
-                    b = np.mean([np.linalg.norm(X[i] - x) for x in other_cluster])
-                    min_b = min(min_b, b)
-            b_values.append(min_b)
+        # Distances from every point to the members of one cluster at a time,
+        # so memory stays at N x cluster_size instead of N x N
+        X = X.reshape(len(X), -1)
+        clusters = np.unique(labels)
+        a_values = np.zeros(len(X))
+        b_values = np.full(len(X), np.inf)
+        for cluster in clusters:
+            in_cluster = labels == cluster
+            diff = X[:, None, :] - X[in_cluster][None, :, :]
+            dist = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+            
+            # a: mean distance to the other (non-identical) members
+            own = dist[in_cluster]
+            if own.shape[1] > 1:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    a_values[in_cluster] = own.sum(axis=1) / np.count_nonzero(own, axis=1)
+            
+            # b: smallest mean distance to any other cluster
+            others = ~in_cluster
+            b_values[others] = np.minimum(b_values[others], dist[others].mean(axis=1))
         
         # Silhouette score
-        silhouette = np.mean([
-            (b - a) / max(a, b) if max(a, b) > 0 else 0
-            for a, b in zip(a_values, b_values)
-        ])
+        denom = np.maximum(a_values, b_values)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = np.where(denom > 0, (b_values - a_values) / denom, 0)
+        silhouette = np.mean(scores)
         
         return {
             'silhouette': float(silhouette),
@@ -618,7 +1192,8 @@ class MLMetrics:
         y_labeled_pred,
         y_unlabeled_pseudo,
         pseudo_confidence=None,
-        consistency_scores=None
+        consistency_scores=None,
+        use_numba: bool = False
     ) -> Dict[str, float]:
         """Calculate semi-supervised learning metrics.
         
@@ -628,25 +1203,46 @@ class MLMetrics:
             y_unlabeled_pseudo: Pseudo-labels for unlabeled data.
             pseudo_confidence: Confidence scores for pseudo-labels (optional).
             consistency_scores: Consistency scores across augmentations (optional).
+            use_numba: If True, compute the reductions with a JIT-compiled
+                Numba kernel (requires numba; numeric labels only). Results can
+                differ from the NumPy path in the last floating-point digits.
         
         Returns:
             Dictionary with labeled accuracy, pseudo-label quality, consistency, etc.
+        
+        Raises:
+            ImportError: If use_numba=True and numba is not installed.
+            ValueError: If y_labeled_true and y_labeled_pred differ in length.
         """
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        y_labeled_true = np.array(y_labeled_true)
-        y_labeled_pred = np.array(y_labeled_pred)
-        y_unlabeled_pseudo = np.array(y_unlabeled_pseudo)
+        # asarray avoids copying inputs that are already ndarrays
+        y_labeled_true = np.asarray(y_labeled_true)
+        y_labeled_pred = np.asarray(y_labeled_pred)
+        y_unlabeled_pseudo = np.asarray(y_unlabeled_pseudo)
         
-        # Labeled data accuracy
-        labeled_accuracy = np.mean(y_labeled_true == y_labeled_pred)
+        # The Numba kernel indexes y_labeled_pred without bounds checks
+        if len(y_labeled_true) != len(y_labeled_pred):
+            raise ValueError(
+                f"y_labeled_true has {len(y_labeled_true)} labels but "
+                f"y_labeled_pred has {len(y_labeled_pred)}"
+            )
         
         # Pseudo-label statistics
         n_labeled = len(y_labeled_true)
         n_unlabeled = len(y_unlabeled_pseudo)
         label_ratio = n_labeled / (n_labeled + n_unlabeled) if (n_labeled + n_unlabeled) > 0 else 0
         
+        if use_numba:
+            return MLMetrics._semi_supervised_metrics_numba(
+                y_labeled_true, y_labeled_pred, y_unlabeled_pseudo,
+                pseudo_confidence, consistency_scores, label_ratio
+            )
+        
+        # Labeled data accuracy
+        labeled_accuracy = (y_labeled_true == y_labeled_pred).mean()
+        
         metrics = {
             'labeled_accuracy': float(labeled_accuracy),
             'n_labeled': int(n_labeled),
@@ -657,15 +1253,55 @@ class MLMetrics:
         
         # Pseudo-label confidence (if provided)
         if pseudo_confidence is not None:
-            pseudo_confidence = np.array(pseudo_confidence)
-            metrics['avg_pseudo_confidence'] = float(np.mean(pseudo_confidence))
-            metrics['high_confidence_ratio'] = float(np.mean(pseudo_confidence > 0.9))
+            pseudo_confidence = np.asarray(pseudo_confidence, dtype=float)
+            metrics['avg_pseudo_confidence'] = float(pseudo_confidence.mean())
+            metrics['high_confidence_ratio'] = float((pseudo_confidence > 0.9).mean())
         
         # Consistency score (if provided)
         if consistency_scores is not None:
-            consistency_scores = np.array(consistency_scores)
-            metrics['avg_consistency'] = float(np.mean(consistency_scores))
-            metrics['consistency_std'] = float(np.std(consistency_scores))
+            consistency_scores = np.asarray(consistency_scores, dtype=float)
+            metrics['avg_consistency'] = float(consistency_scores.mean())
+            metrics['consistency_std'] = float(consistency_scores.std())
+        
+        return metrics
+    
+    @staticmethod
+    def _semi_supervised_metrics_numba(
+        y_labeled_true,
+        y_labeled_pred,
+        y_unlabeled_pseudo,
+        pseudo_confidence,
+        consistency_scores,
+        label_ratio
+    ) -> Dict[str, float]:
+        """Numba-backed body of semi_supervised_metrics (inputs already ndarrays)."""
+        from ._numba_impl import get_ssl_kernel
+        
+        kernel = get_ssl_kernel()
+        empty = np.empty(0, dtype=np.float64)
+        confidence = empty if pseudo_confidence is None else np.asarray(pseudo_confidence, dtype=np.float64)
+        consistency = empty if consistency_scores is None else np.asarray(consistency_scores, dtype=np.float64)
+        
+        n_correct, avg_conf, high_conf_ratio, avg_cons, cons_std = kernel(
+            y_labeled_true, y_labeled_pred, confidence, consistency
+        )
+        
+        n_labeled = len(y_labeled_true)
+        metrics = {
+            'labeled_accuracy': float(n_correct / n_labeled) if n_labeled else float('nan'),
+            'n_labeled': int(n_labeled),
+            'n_unlabeled': int(len(y_unlabeled_pseudo)),
+            'label_ratio': float(label_ratio),
+            'pseudo_label_diversity': float(len(np.unique(y_unlabeled_pseudo)) / max(1, len(np.unique(y_labeled_true))))
+        }
+        
+        if pseudo_confidence is not None:
+            metrics['avg_pseudo_confidence'] = float(avg_conf)
+            metrics['high_confidence_ratio'] = float(high_conf_ratio)
+        
+        if consistency_scores is not None:
+            metrics['avg_consistency'] = float(avg_cons)
+            metrics['consistency_std'] = float(cons_std)
         
         return metrics
     
@@ -690,8 +1326,8 @@ class MLMetrics:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        episode_rewards = np.array(episode_rewards)
-        episode_lengths = np.array(episode_lengths)
+        episode_rewards = np.asarray(episode_rewards, dtype=float)
+        episode_lengths = np.asarray(episode_lengths)
         
         metrics = {
             'mean_reward': float(np.mean(episode_rewards)),
@@ -705,13 +1341,13 @@ class MLMetrics:
         
         # Success rate (if provided)
         if success_flags is not None:
-            success_flags = np.array(success_flags)
-            metrics['success_rate'] = float(np.mean(success_flags))
-            metrics['n_successes'] = int(np.sum(success_flags))
+            success_flags = np.asarray(success_flags, dtype=bool)
+            metrics['success_rate'] = float(success_flags.mean())
+            metrics['n_successes'] = int(np.count_nonzero(success_flags))
         
         # Q-value statistics (if provided)
         if q_values is not None:
-            q_values = np.array(q_values)
+            q_values = np.asarray(q_values, dtype=float)
             metrics['mean_q_value'] = float(np.mean(q_values))
             metrics['std_q_value'] = float(np.std(q_values))
             metrics['max_q_value'] = float(np.max(q_values))
@@ -720,11 +1356,11 @@ class MLMetrics:
         if len(episode_rewards) >= 10:
             # Recent performance (last 20%)
             recent_window = max(10, len(episode_rewards) // 5)
-            recent_rewards = episode_rewards[-recent_window:]
-            metrics['recent_mean_reward'] = float(np.mean(recent_rewards))
+            recent_mean = episode_rewards[-recent_window:].mean()
+            early_mean = episode_rewards[:recent_window].mean()
+            metrics['recent_mean_reward'] = float(recent_mean)
             metrics['improvement_rate'] = float(
-                (np.mean(recent_rewards) - np.mean(episode_rewards[:recent_window])) / 
-                (np.mean(episode_rewards[:recent_window]) + 1e-8)
+                (recent_mean - early_mean) / (early_mean + 1e-8)
             )
         
         return metrics
@@ -752,7 +1388,7 @@ class MLMetrics:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy is required for metric calculation")
         
-        client_accuracies = np.array(client_accuracies)
+        client_accuracies = np.asarray(client_accuracies)
         
         metrics = {
             'global_accuracy': float(np.mean(client_accuracies)),
@@ -772,19 +1408,19 @@ class MLMetrics:
         
         # Client losses (if provided)
         if client_losses is not None:
-            client_losses = np.array(client_losses)
+            client_losses = np.asarray(client_losses)
             metrics['global_loss'] = float(np.mean(client_losses))
             metrics['loss_std'] = float(np.std(client_losses))
         
         # Model divergence (if provided)
         if model_divergences is not None:
-            model_divergences = np.array(model_divergences)
+            model_divergences = np.asarray(model_divergences)
             metrics['avg_model_divergence'] = float(np.mean(model_divergences))
             metrics['max_model_divergence'] = float(np.max(model_divergences))
         
         # Participation metrics (if provided)
         if participation_rates is not None:
-            participation_rates = np.array(participation_rates)
+            participation_rates = np.asarray(participation_rates)
             metrics['avg_participation_rate'] = float(np.mean(participation_rates))
             metrics['min_participation_rate'] = float(np.min(participation_rates))
         
@@ -40,6 +40,8 @@ setup(
         "tensorflow": ["tensorflow>=2.0.0"],
         "numpy": ["numpy>=1.19.0"],
         "pandas": ["pandas>=1.3.0"],
+        "blake3": ["blake3>=0.3.0"],
+        "numba": ["numba>=0.56.0"],
         "experiment": ["pandas>=1.3.0", "numpy>=1.19.0"],  # For experiment management
         "all": [
             "torch>=1.7.0",
@@ -127,6 +127,146 @@ def test_different_experiments():
     print()
 
 
+def test_numpy_generator():
+    """Test the per-generator NumPy Generator stream."""
+    print("=" * 60)
+    print("Test 6: NumPy Generator")
+    print("=" * 60)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not installed - skipping\n")
+        return
+    
+    gen = SeedHashGenerator("test_experiment")
+    draws1 = gen.get_numpy_generator().random(5)
+    draws2 = gen.get_numpy_generator().random(5)
+    
+    assert isinstance(gen.get_numpy_generator(), np.random.Generator)
+    assert np.array_equal(draws1, draws2), "Generator streams should be reproducible"
+    assert np.array_equal(draws1, np.random.default_rng(gen.seed_number).random(5))
+    
+    print(f"First draws: {draws1}")
+    print("✓ NumPy Generator is reproducible from the input string!\n")
+
+
+def test_batched_generate_seeds():
+    """Test that large seed batches match the per-draw randint stream."""
+    print("=" * 60)
+    print("Test 7: Batched Seed Generation")
+    print("=" * 60)
+    
+    import random
+    
+    for min_value, max_value in [(None, None), (1, 6), (0, 2**32)]:
+        gen = SeedHashGenerator("test_experiment", min_value, max_value)
+        rng = random.Random(gen.seed_number)
+        expected = [rng.randint(gen.min_value, gen.max_value) for _ in range(2000)]
+        
+        assert gen.generate_seeds(2000) == expected, "Batched seeds must match randint"
+        print(f"Range [{gen.min_value}, {gen.max_value}]: first seeds {expected[:3]}")
+    
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not installed - skipping generate_seeds_array\n")
+        return
+    
+    assert gen.generate_seeds_array(2000).tolist() == expected
+    print("✓ generate_seeds is bit-identical to the randint loop!\n")
+
+
+def test_generate_seeds_fast():
+    """Test the hash-stream seed generator."""
+    print("=" * 60)
+    print("Test 8: Hash-Stream Seeds")
+    print("=" * 60)
+    
+    gen = SeedHashGenerator("test_experiment", min_value=1, max_value=1000)
+    seeds = gen.generate_seeds_fast(500)
+    
+    assert seeds == SeedHashGenerator("test_experiment", 1, 1000).generate_seeds_fast(500)
+    assert seeds[:10] == gen.generate_seeds_fast(10), "Shorter runs should be prefixes"
+    assert all(1 <= s <= 1000 for s in seeds)
+    
+    print(f"First seeds: {seeds[:5]}")
+    print("✓ generate_seeds_fast is deterministic and in range!\n")
+
+
+def test_frozen_seed_hash():
+    """Test the hashable seed specification."""
+    print("=" * 60)
+    print("Test 9: FrozenSeedHash")
+    print("=" * 60)
+    
+    from seedhash import FrozenSeedHash
+    
+    spec = FrozenSeedHash("test_experiment", 0, 1000)
+    gen = SeedHashGenerator("test_experiment", 0, 1000)
+    cache = {spec: spec.generate_seeds(5)}
+    
+    assert spec.seed_number == gen.seed_number
+    assert cache[FrozenSeedHash("test_experiment", 0, 1000)] == gen.generate_seeds(5)
+    
+    print(f"Spec: {spec}")
+    print("✓ FrozenSeedHash works as a dict key!\n")
+
+
+def test_set_seed_status():
+    """Test set_seed's status dict and framework validation."""
+    print("=" * 60)
+    print("Test 10: set_seed Status and Errors")
+    print("=" * 60)
+    
+    import importlib.util
+    import random
+    
+    gen = SeedHashGenerator("status_test")
+    numpy_available = importlib.util.find_spec("numpy") is not None
+    
+    # "python" seeds only the random module
+    status = gen.set_seed("python")
+    assert status == {"python": "seeded"}
+    first = random.random()
+    random.seed(gen.seed_number)
+    assert random.random() == first
+    print(f"python: {status}")
+    
+    # "numpy" also seeds Python; it is an error only if NumPy is missing
+    try:
+        status = gen.set_seed("numpy")
+        assert numpy_available
+        assert status == {"python": "seeded", "numpy": "seeded"}
+        import numpy as np
+        first = np.random.random()
+        np.random.seed(gen.seed_number)
+        assert np.random.random() == first
+        print(f"numpy: {status}")
+    except ImportError:
+        assert not numpy_available
+        print("numpy: not installed (ImportError raised as expected)")
+    
+    # "all" reports every framework, marking missing ones instead of raising
+    status = gen.set_seed("all", deterministic=False)
+    assert list(status) == ["python", "numpy", "torch", "tensorflow"]
+    assert status["python"] == "seeded"
+    assert status["numpy"] == ("seeded" if numpy_available else "not_available")
+    assert all(status[name] in ("seeded", "not_available") for name in ("torch", "tensorflow"))
+    print(f"all: {status}")
+    
+    # Unknown framework names are rejected with the valid options listed
+    try:
+        gen.set_seed("jax")
+    except ValueError as e:
+        assert "Invalid framework 'jax'" in str(e) and "'python'" in str(e)
+        print(f"jax: ValueError: {e}")
+    else:
+        raise AssertionError("set_seed('jax') should raise ValueError")
+    
+    print("✓ set_seed dispatch works!\n")
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("SEEDHASH: Deep Learning Framework Seeding Tests")
@@ -137,6 +277,11 @@ if __name__ == "__main__":
     test_seed_all()
     test_deterministic_mode()
     test_different_experiments()
+    test_numpy_generator()
+    test_batched_generate_seeds()
+    test_generate_seeds_fast()
+    test_frozen_seed_hash()
+    test_set_seed_status()
     
     print("=" * 60)
     print("All tests completed successfully!")
@@ -8,6 +8,7 @@ sys.path.insert(0, 'Python')
 
 from seedhash import SeedHashGenerator
 import hashlib
+import struct
 
 
 def test_md5_consistency():
@@ -107,6 +108,8 @@ def test_md5_to_seed_conversion():
     print(f"Match: {seed_val == expected_seed}")
     
     assert seed_val == expected_seed, "Seed conversion is incorrect"
+    # digest % 2^32 is the digest's last 4 bytes read big-endian
+    assert seed_val == struct.unpack('>I', bytes.fromhex(hash_val)[-4:])[0]
     assert isinstance(seed_val, int), "Seed should be an integer"
     assert 0 <= seed_val < 2**32, f"Seed should be in range [0, 2^32), got {seed_val}"
     
@@ -119,11 +122,12 @@ def test_md5_distribution():
     print("Test 5: MD5 Distribution Quality")
     print("=" * 70)
     
-    # Generate seeds from sequential strings
-    seeds = []
-    for i in range(100):
-        gen = SeedHashGenerator(f"experiment_{i}")
-        seeds.append(gen.seed_number)
+    # Generate seeds from sequential strings (batch API; Test 7 checks it
+    # against per-generator seeds)
+    seeds = [
+        int(seed) for seed in
+        SeedHashGenerator.seed_numbers([str(i) for i in range(100)], prefix="experiment_")
+    ]
     
     # Check for uniqueness
     unique_seeds = len(set(seeds))
@@ -144,10 +148,114 @@ def test_md5_distribution():
     print("✓ MD5 provides good distribution\n")
 
 
+def test_hash_algorithm_selection():
+    """Test that MD5 stays the default and other algorithms are opt-in."""
+    print("=" * 70)
+    print("Test 6: Hash Algorithm Selection")
+    print("=" * 70)
+    
+    default_gen = SeedHashGenerator("algorithm_test")
+    md5_gen = SeedHashGenerator("algorithm_test", algorithm="md5")
+    
+    print(f"Default algorithm: {default_gen.algorithm}")
+    assert default_gen.algorithm == "md5", "MD5 should be the default algorithm"
+    assert default_gen.seed_number == md5_gen.seed_number, "Default seed should match MD5 seed"
+    
+    blake2b_gen = SeedHashGenerator("algorithm_test", algorithm="blake2b")
+    expected = hashlib.blake2b(b"algorithm_test", digest_size=16).hexdigest()
+    print(f"BLAKE2b seed: {blake2b_gen.seed_number}")
+    assert blake2b_gen.get_hash() == expected, "get_hash should use the chosen algorithm"
+    assert blake2b_gen.seed_number == int(expected, 16) % (2**32)
+    
+    try:
+        SeedHashGenerator("algorithm_test", algorithm="sha1")
+    except ValueError as e:
+        print(f"Caught expected error: {e}")
+    else:
+        raise AssertionError("Unsupported algorithm should raise ValueError")
+    
+    print("✓ Hash algorithm selection works\n")
+
+
+def test_batch_seed_numbers():
+    """Test that batch seed derivation matches per-generator seeds."""
+    print("=" * 70)
+    print("Test 7: Batch Seed Derivation")
+    print("=" * 70)
+    
+    inputs = [f"batch_{i}" for i in range(100)] + ["测试", "🎲"]
+    expected = [SeedHashGenerator(s).seed_number for s in inputs]
+    batch = SeedHashGenerator.seed_numbers(inputs)
+    
+    print(f"First batch seeds: {[int(x) for x in batch[:3]]}")
+    assert [int(x) for x in batch] == expected, "Batch seeds must match per-string seeds"
+    
+    prefixed = SeedHashGenerator.seed_numbers([s[len("batch_"):] for s in inputs[:100]], prefix="batch_")
+    assert [int(x) for x in prefixed] == expected[:100], "Prefixed seeds must match full strings"
+    
+    print("✓ Batch seed derivation matches SeedHashGenerator.seed_number\n")
+
+
+def test_unchecked_constructor():
+    """Test that unchecked() builds the same generator as the constructor."""
+    print("=" * 70)
+    print("Test 8: Unchecked Constructor")
+    print("=" * 70)
+    
+    import importlib.util
+    
+    algorithms = ["md5", "blake2b"]
+    if importlib.util.find_spec("blake3") is not None:
+        algorithms.append("blake3")
+    
+    # SeedHashGenerator uses __slots__, so collect the slot values directly
+    slots = [name for name in SeedHashGenerator.__slots__ if name != "__weakref__"]
+    state = lambda gen: {name: getattr(gen, name) for name in slots}
+    
+    cases = [("experiment_1", None, None), ("测试", 0, 1000), ("🎲", -50, 50), ("wide_range", 10**12, 10**15)]
+    for algorithm in algorithms:
+        for input_string, min_value, max_value in cases:
+            checked = SeedHashGenerator(input_string, min_value, max_value, algorithm=algorithm)
+            fast = SeedHashGenerator.unchecked(input_string, min_value, max_value, algorithm=algorithm)
+            
+            # Same attributes, so any drift in the duplicated setup shows up here
+            assert state(fast) == state(checked), (algorithm, input_string)
+            assert fast.seed_number == checked.seed_number
+            assert fast.get_hash() == checked.get_hash()
+            # Small and batched (NumPy) generation paths
+            assert fast.generate_seeds(5) == checked.generate_seeds(5)
+            assert fast.generate_seeds(2000) == checked.generate_seeds(2000)
+        print(f"✓ {algorithm}: unchecked() matches SeedHashGenerator() for {len(cases)} inputs")
+    
+    print()
+
+
+def test_derive_seed():
+    """Test indexed seed derivation with keyed BLAKE2b."""
+    print("=" * 70)
+    print("Test 9: Indexed Seed Derivation")
+    print("=" * 70)
+    
+    gen = SeedHashGenerator("derive_test")
+    seeds = [gen.derive_seed(i) for i in range(1000)]
+    expected = int.from_bytes(
+        hashlib.blake2b(b"derive_test", digest_size=4, salt=(3).to_bytes(8, 'little')).digest(),
+        'little'
+    )
+    
+    print(f"First derived seeds: {seeds[:3]}")
+    assert seeds == [SeedHashGenerator("derive_test").derive_seed(i) for i in range(1000)]
+    assert seeds[3] == expected, "derive_seed should be BLAKE2b keyed on the index"
+    assert len(set(seeds)) == len(seeds), "Derived seeds should not collide"
+    assert all(0 <= s < 2**32 for s in seeds)
+    
+    print("✓ Indexed seed derivation works\n")
+
+
 def test_md5_security_context():
     """Explain the security context of MD5 usage."""
     print("=" * 70)
-    print("Test 6: Security Context Analysis")
+    print("Test 10: Security Context Analysis")
     print("=" * 70)
     
     print("MD5 Usage in seedhash:")
@@ -181,7 +289,7 @@ def test_md5_security_context():
 def test_potential_issues():
     """Test for potential issues with MD5 implementation."""
     print("=" * 70)
-    print("Test 7: Potential Issues Check")
+    print("Test 11: Potential Issues Check")
     print("=" * 70)
     
     issues_found = []
@@ -237,6 +345,10 @@ if __name__ == "__main__":
     test_md5_encoding()
     test_md5_to_seed_conversion()
     test_md5_distribution()
+    test_hash_algorithm_selection()
+    test_batch_seed_numbers()
+    test_unchecked_constructor()
+    test_derive_seed()
     test_md5_security_context()
     test_potential_issues()
     
@@ -12,7 +12,7 @@ import sys
 sys.path.insert(0, 'Python')
 
 from seedhash import SeedSampler
-import statistics
+import numpy as np
 
 
 def test_simple_random_sampling():
@@ -31,9 +31,10 @@ def test_simple_random_sampling():
     print(f"Master seed: {sampler.master_seed}")
     print(f"Number of samples: {len(samples)}")
     print(f"Samples: {samples[:10]}... (showing first 10)")
-    print(f"Range: [{min(samples)}, {max(samples)}]")
-    print(f"Mean: {statistics.mean(samples):.2f}")
-    print(f"Std Dev: {statistics.stdev(samples):.2f}")
+    arr = np.asarray(samples)
+    print(f"Range: [{arr.min()}, {arr.max()}]")
+    print(f"Mean: {arr.mean():.2f}")
+    print(f"Std Dev: {arr.std(ddof=1):.2f}")
     print(f"\n✅ Simple random sampling works!\n")
 
 
@@ -61,10 +62,8 @@ def test_stratified_random_sampling():
     
     # Verify stratification
     stratum_size = 1000 // n_strata
-    strata_counts = [0] * n_strata
-    for sample in samples:
-        stratum_idx = min(sample // stratum_size, n_strata - 1)
-        strata_counts[stratum_idx] += 1
+    strata_idx = np.minimum(np.asarray(samples) // stratum_size, n_strata - 1)
+    strata_counts = np.bincount(strata_idx, minlength=n_strata).tolist()
     
     print(f"\nSamples per stratum: {strata_counts}")
     print(f"✅ Stratified random sampling works!\n")
@@ -92,7 +91,7 @@ def test_cluster_random_sampling():
     print(f"Samples per cluster: {5}")
     print(f"Sorted samples: {sorted(samples)}")
     print(f"Range: [{min(samples)}, {max(samples)}]")
-    print(f"Mean: {statistics.mean(samples):.2f}")
+    print(f"Mean: {np.mean(samples):.2f}")
     
     # Show clustering effect (samples should be grouped)
     sorted_samples = sorted(samples)
@@ -125,11 +124,14 @@ def test_systematic_random_sampling():
     print(f"Range: [{min(samples)}, {max(samples)}]")
     
     # Calculate actual intervals
-    sorted_samples = sorted(samples)
-    intervals = [sorted_samples[i+1] - sorted_samples[i] for i in range(len(sorted_samples)-1)]
+    intervals = np.diff(np.sort(samples))
     print(f"\nActual intervals between samples:")
-    print(f"  Min: {min(intervals)}, Max: {max(intervals)}, Mean: {statistics.mean(intervals):.2f}")
-    print(f"  Intervals: {intervals}")
+    print(f"  Min: {intervals.min()}, Max: {intervals.max()}, Mean: {intervals.mean():.2f}")
+    print(f"  Intervals: {intervals.tolist()}")
+    
+    # The array form holds the same seeds
+    as_array = sampler.systematic_random_sampling(15, (0, 1000), as_array=True)
+    assert as_array.tolist() == samples, "as_array=True should match the list"
     
     print(f"\n✅ Systematic random sampling works!\n")
 
@@ -188,8 +190,402 @@ def test_integration_with_experiment_manager():
     print(f"\n✅ All sampling methods integrate with SeedExperimentManager!\n")
 
 
+def test_spawn_seed_hierarchy():
+    """Test 7: SeedSequence-based hierarchy"""
+    print("=" * 70)
+    print("TEST 7: SEEDSEQUENCE SPAWN HIERARCHY")
+    print("=" * 70)
+    print("Spawned hierarchies are reproducible and respect the seed range.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    hierarchy1 = SeedExperimentManager("test_spawn").spawn_seed_hierarchy(4, 3, 2, (0, 1000))
+    hierarchy2 = SeedExperimentManager("test_spawn").spawn_seed_hierarchy(4, 3, 2, (0, 1000))
+    
+    print(f"Level 1: {hierarchy1[1]}")
+    print(f"Level 2: {hierarchy1[2]}")
+    assert hierarchy1 == hierarchy2, "Spawned hierarchy should be reproducible"
+    assert len(hierarchy1[1]) == 4 and len(hierarchy1[2]) == 12
+    assert all(0 <= s <= 1000 for s in hierarchy1[1] + hierarchy1[2])
+    
+    print(f"\n✅ SeedSequence spawn hierarchy works!\n")
+
+
+def test_bulk_experiment_results():
+    """Test 8: Bulk result recording"""
+    print("=" * 70)
+    print("TEST 8: BULK EXPERIMENT RESULTS")
+    print("=" * 70)
+    print("add_experiment_results_bulk matches one add_experiment_result per record.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    single = SeedExperimentManager("test_bulk")
+    bulk = SeedExperimentManager("test_bulk")
+    seeds = single.generate_seed_hierarchy(n_seeds=3, n_sub_seeds=2, max_depth=2)[2]
+    bulk.generate_seed_hierarchy(n_seeds=3, n_sub_seeds=2, max_depth=2)
+    
+    records = [(seed, {"rmse": i / 10}, "simple", {"run": i}) for i, seed in enumerate(seeds)]
+    for seed, metrics, method, metadata in records:
+        single.add_experiment_result(seed, "regression", metrics, method, metadata)
+    bulk.add_experiment_results_bulk(records, ml_task="regression")
+    
+    print(f"Recorded {len(bulk.results)} results in one call")
+    # Timestamps are wall-clock, so compare everything else
+    drop_time = lambda m: [{k: v for k, v in r.to_dict().items() if k != "timestamp"} for r in m.results]
+    assert drop_time(bulk) == drop_time(single)
+    assert list(bulk.get_results_dataframe().columns) == list(single.get_results_dataframe().columns)
+    
+    print(f"\n✅ Bulk result recording works!\n")
+
+
+def test_columnar_experiment_results():
+    """Test 9: Columnar result recording"""
+    print("=" * 70)
+    print("TEST 9: COLUMNAR EXPERIMENT RESULTS")
+    print("=" * 70)
+    print("add_experiment_results_columns matches one add_experiment_result per seed.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    single = SeedExperimentManager("test_columns")
+    columnar = SeedExperimentManager("test_columns")
+    seeds = single.generate_seed_hierarchy(n_seeds=3, n_sub_seeds=2, max_depth=2)[2]
+    columnar.generate_seed_hierarchy(n_seeds=3, n_sub_seeds=2, max_depth=2)
+    
+    rmse = [i / 10 for i in range(len(seeds))]
+    for i, seed in enumerate(seeds):
+        single.add_experiment_result(seed, "regression", {"rmse": rmse[i]}, "simple", {"run": i})
+    columnar.add_experiment_results_columns(
+        seeds, "regression", {"rmse": rmse}, "simple", {"run": list(range(len(seeds)))}
+    )
+    
+    df_single = single.get_results_dataframe().drop(columns="timestamp")
+    df_columnar = columnar.get_results_dataframe().drop(columns="timestamp")
+    print(f"Recorded {len(df_columnar)} rows from column data")
+    assert df_columnar.equals(df_single)
+    
+    # ExperimentResult objects are built on demand and match as well
+    drop_time = lambda m: [{k: v for k, v in r.to_dict().items() if k != "timestamp"} for r in m.results]
+    assert drop_time(columnar) == drop_time(single)
+    
+    print(f"\n✅ Columnar result recording works!\n")
+
+
+def test_export_multiple_formats():
+    """Test 10: Exporting several formats in one call"""
+    print("=" * 70)
+    print("TEST 10: MULTI-FORMAT EXPORT")
+    print("=" * 70)
+    print("export_results writes every requested format from one DataFrame.\n")
+    
+    import json
+    import tempfile
+    from pathlib import Path
+    import pandas as pd
+    from seedhash import SeedExperimentManager
+    
+    manager = SeedExperimentManager("test_export")
+    seeds = manager.generate_seed_hierarchy(n_seeds=2, n_sub_seeds=2, max_depth=2)[2]
+    for i, seed in enumerate(seeds):
+        manager.add_experiment_result(seed, "regression", {"rmse": i / 10}, "simple")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "results.csv"
+        json_path = Path(tmp) / "results.json"
+        manager.export_results([csv_path, str(json_path)], format=["csv", "json"])
+        
+        csv_rows = pd.read_csv(csv_path)
+        with open(json_path, encoding="utf-8") as f:
+            json_rows = json.load(f)
+        print(f"CSV rows: {len(csv_rows)}, JSON rows: {len(json_rows)}")
+        assert csv_rows["current_seed"].tolist() == seeds
+        assert [row["current_seed"] for row in json_rows] == seeds
+        assert csv_rows["metric_rmse"].tolist() == [row["metric_rmse"] for row in json_rows]
+        
+        # A single pathlib.Path is one file, not a list of paths
+        single_path = Path(tmp) / "single.csv"
+        manager.export_results(single_path)
+        assert pd.read_csv(single_path)["current_seed"].tolist() == seeds
+    
+    print(f"\n✅ Multi-format export works!\n")
+
+
+def test_results_cache():
+    """Test 11: Cached results DataFrame and summary"""
+    print("=" * 70)
+    print("TEST 11: RESULTS CACHE")
+    print("=" * 70)
+    print("The DataFrame and summary are rebuilt only when results change.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    manager = SeedExperimentManager("test_cache")
+    manager.add_experiment_result(1, "regression", {"rmse": 1.0}, "simple")
+    manager.add_experiment_result(2, "regression", {"rmse": 1.0}, "simple")
+    
+    # Returned objects are copies: mutating them leaves the caches intact
+    df = manager.get_results_dataframe()
+    df.loc[0, "metric_rmse"] = -1.0
+    summary = manager.get_summary_statistics()
+    summary["metric_statistics"]["rmse"]["mean"] = -1.0
+    assert manager.get_results_dataframe()["metric_rmse"].tolist() == [1.0, 1.0]
+    assert manager.get_summary_statistics()["metric_statistics"]["rmse"]["mean"] == 1.0
+    
+    # Adding a result invalidates both caches
+    manager.add_experiment_result(3, "regression", {"rmse": 4.0}, "simple")
+    assert manager.get_results_dataframe()["metric_rmse"].tolist() == [1.0, 1.0, 4.0]
+    assert manager.get_summary_statistics()["metric_statistics"]["rmse"]["mean"] == 2.0
+    
+    # In-place edits of self.results take effect after invalidate_cache()
+    manager.results[0].metrics["rmse"] = 99.0
+    manager.invalidate_cache()
+    rmse = manager.get_results_dataframe()["metric_rmse"].tolist()
+    print(f"RMSE column after in-place edit: {rmse}")
+    assert rmse == [99.0, 1.0, 4.0]
+    assert manager.get_summary_statistics()["metric_statistics"]["rmse"]["max"] == 99.0
+    
+    print(f"\n✅ Results cache works!\n")
+
+
+def test_hierarchy_disk_cache():
+    """Test 12: On-disk seed hierarchy cache"""
+    print("=" * 70)
+    print("TEST 12: HIERARCHY DISK CACHE")
+    print("=" * 70)
+    print("cache_dir stores hierarchies as JSON keyed by parameters and format version.\n")
+    
+    import os
+    import tempfile
+    from seedhash import SeedExperimentManager
+    from seedhash import experiment
+    
+    manager = SeedExperimentManager("test_disk_cache")
+    params = dict(n_seeds=4, n_sub_seeds=3, max_depth=2, sampling_method="cluster")
+    uncached = manager.generate_seed_hierarchy(**params)
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Cold: the hierarchy is generated and written to the cache
+        cold = manager.generate_seed_hierarchy(**params, cache_dir=cache_dir)
+        files = os.listdir(cache_dir)
+        print(f"Cache files after cold call: {files}")
+        assert len(files) == 1 and files[0].startswith("hierarchy_")
+        assert cold == uncached
+        
+        # Warm: read back from the file, identical to the uncached hierarchy
+        warm = manager.generate_seed_hierarchy(**params, cache_dir=cache_dir)
+        assert warm == uncached
+        assert os.listdir(cache_dir) == files
+        
+        # A new cache format version misses the old file and writes its own
+        old_version = experiment._HIERARCHY_CACHE_VERSION
+        experiment._HIERARCHY_CACHE_VERSION = old_version + 1
+        try:
+            bumped = manager.generate_seed_hierarchy(**params, cache_dir=cache_dir)
+        finally:
+            experiment._HIERARCHY_CACHE_VERSION = old_version
+        assert bumped == uncached
+        assert len(os.listdir(cache_dir)) == 2
+    
+    print(f"\n✅ Hierarchy disk cache works!\n")
+
+
+def test_semi_supervised_numba_matches_numpy():
+    """Test 13: Numba semi-supervised metrics match the NumPy path"""
+    print("=" * 70)
+    print("TEST 13: SEMI-SUPERVISED METRICS (NUMBA VS NUMPY)")
+    print("=" * 70)
+    print("use_numba=True gives the NumPy results, NaN for empty scores and the same errors.\n")
+    
+    import math
+    import warnings
+    import pytest
+    pytest.importorskip("numba")
+    from seedhash import MLMetrics
+    
+    rng = np.random.default_rng(7)
+    y_true = rng.integers(0, 3, 60)
+    y_pred = np.where(rng.random(60) < 0.2, rng.integers(0, 3, 60), y_true)
+    pseudo = rng.integers(0, 3, 200)
+    confidence = rng.uniform(0.6, 0.99, 200)
+    consistency = rng.uniform(0.7, 0.95, 200)
+    
+    def check(*args):
+        with warnings.catch_warnings():
+            # NumPy warns on the mean of an empty array
+            warnings.simplefilter("ignore", RuntimeWarning)
+            expected = MLMetrics.semi_supervised_metrics(*args)
+        actual = MLMetrics.semi_supervised_metrics(*args, use_numba=True)
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            assert (math.isnan(value) and math.isnan(actual[key])) or math.isclose(
+                actual[key], value, rel_tol=1e-12, abs_tol=1e-12
+            ), key
+        return actual
+    
+    metrics = check(y_true, y_pred, pseudo, confidence, consistency)
+    print(f"Labeled accuracy: {metrics['labeled_accuracy']:.3f}")
+    check(y_true, y_pred, pseudo)
+    
+    # Empty score arrays give NaN statistics on both paths
+    empty = check(y_true, y_pred, pseudo, [], [])
+    assert math.isnan(empty['avg_pseudo_confidence']) and math.isnan(empty['consistency_std'])
+    
+    # Mismatched label lengths are rejected before either path runs
+    for use_numba in (False, True):
+        with pytest.raises(ValueError):
+            MLMetrics.semi_supervised_metrics(y_true, y_pred[:10], pseudo, use_numba=use_numba)
+    
+    print(f"\n✅ Numba semi-supervised metrics match NumPy!\n")
+
+
+def test_multiclass_classification_metrics():
+    """Test 14: Multi-class macro precision/recall/F1"""
+    print("=" * 70)
+    print("TEST 14: MULTI-CLASS CLASSIFICATION METRICS")
+    print("=" * 70)
+    print("Macro-averaged metrics from the confusion matrix match hand-computed values.\n")
+    
+    import math
+    from seedhash import MLMetrics
+    
+    y_true = [0, 0, 0, 1, 1, 1, 2, 2, 2, 2]
+    y_pred = [0, 0, 1, 1, 1, 1, 2, 2, 1, 2]
+    # Per class: TP = 2, 3, 3; predicted = 2, 5, 3; actual = 3, 3, 4
+    precision = (2 / 2 + 3 / 5 + 3 / 3) / 3  # 13/15
+    recall = (2 / 3 + 3 / 3 + 3 / 4) / 3     # 29/36
+    f1 = 2 * precision * recall / (precision + recall)
+    
+    metrics = MLMetrics.classification_metrics(y_true, y_pred)
+    print(f"Metrics: {metrics}")
+    assert math.isclose(metrics['accuracy'], 0.8)
+    assert math.isclose(metrics['precision'], 13 / 15)
+    assert math.isclose(metrics['recall'], 29 / 36)
+    assert math.isclose(metrics['f1'], f1)
+    
+    # String labels take the np.unique path and give the same result
+    names = {0: "cat", 1: "dog", 2: "fox"}
+    named = MLMetrics.classification_metrics(
+        [names[y] for y in y_true], [names[y] for y in y_pred]
+    )
+    assert all(math.isclose(named[key], metrics[key]) for key in metrics)
+    
+    print(f"\n✅ Multi-class classification metrics work!\n")
+
+
+def test_metric_dtype():
+    """Test 15: metric_dtype option"""
+    print("=" * 70)
+    print("TEST 15: METRIC DTYPE")
+    print("=" * 70)
+    print("metric_dtype casts every metric_* column and leaves the rest alone.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    def frame(**options):
+        manager = SeedExperimentManager("test_metric_dtype", **options)
+        for i in range(3):
+            manager.add_experiment_result(
+                i, "regression", {"rmse": i / 10, "r2": 1 - i / 10}, "simple", {"run": i}
+            )
+        return manager.get_results_dataframe()
+    
+    default = frame()
+    compact = frame(metric_dtype="float32")
+    print(f"Default metric dtypes: {default[['metric_r2', 'metric_rmse']].dtypes.tolist()}")
+    print(f"float32 metric dtypes: {compact[['metric_r2', 'metric_rmse']].dtypes.tolist()}")
+    assert all(default[col].dtype == np.float64 for col in ('metric_r2', 'metric_rmse'))
+    assert all(compact[col].dtype == np.float32 for col in ('metric_r2', 'metric_rmse'))
+    # Non-metric columns keep their inferred dtypes
+    other = [col for col in default.columns if not col.startswith('metric_')]
+    assert (compact[other].dtypes == default[other].dtypes).all()
+    
+    print(f"\n✅ metric_dtype works!\n")
+
+
+def test_compact_dtypes():
+    """Test 16: compact_dtypes option"""
+    print("=" * 70)
+    print("TEST 16: COMPACT DTYPES")
+    print("=" * 70)
+    print("compact_dtypes stores categoricals, nullable ints and a downcast seed_level.\n")
+    
+    import importlib.util
+    import pandas as pd
+    from seedhash import SeedExperimentManager
+    
+    def frame(**options):
+        manager = SeedExperimentManager("test_compact_dtypes", **options)
+        seeds = manager.generate_seed_hierarchy(n_seeds=2, n_sub_seeds=2, max_depth=2)
+        # Level-1 seeds have no sub_seed, so that column holds missing values
+        for seed in seeds[1] + seeds[2]:
+            manager.add_experiment_result(seed, "regression", {"rmse": 0.5}, "simple")
+        return manager.get_results_dataframe()
+    
+    default = frame()
+    
+    # Without pyarrow, experiment_id keeps pandas' default string dtype
+    find_spec = importlib.util.find_spec
+    importlib.util.find_spec = lambda name, *args: None if name == "pyarrow" else find_spec(name, *args)
+    try:
+        compact = frame(compact_dtypes=True)
+    finally:
+        importlib.util.find_spec = find_spec
+    print(f"Compact dtypes:\n{compact.dtypes.to_string()}")
+    
+    assert isinstance(compact['sampling_method'].dtype, pd.CategoricalDtype)
+    assert isinstance(compact['ml_task'].dtype, pd.CategoricalDtype)
+    assert compact['seed'].dtype == "Int64" and compact['sub_seed'].dtype == "Int64"
+    assert compact['sub_seed'].isna().sum() == 2
+    assert compact['seed_level'].dtype == np.int8
+    assert compact['experiment_id'].dtype == default['experiment_id'].dtype
+    # Values are unchanged, only their storage
+    assert compact['sub_seed'].astype("float64").equals(default['sub_seed'].astype("float64"))
+    assert compact['sampling_method'].astype(str).tolist() == default['sampling_method'].tolist()
+    
+    if importlib.util.find_spec("pyarrow") is not None:
+        with_arrow = frame(compact_dtypes=True)
+        assert with_arrow['experiment_id'].dtype == "string[pyarrow]"
+    
+    print(f"\n✅ compact_dtypes works!\n")
+
+
+def test_generate_leaf_seeds():
+    """Test 17: Lazy leaf seed generation"""
+    print("=" * 70)
+    print("TEST 17: LEAF SEEDS")
+    print("=" * 70)
+    print("generate_leaf_seeds matches the first n seeds of the hierarchy's last level.\n")
+    
+    from seedhash import SeedExperimentManager
+    
+    for method in ["simple", "stratified", "cluster", "systematic"]:
+        for max_depth in (1, 2, 3):
+            full = SeedExperimentManager("test_leaves")
+            lazy = SeedExperimentManager("test_leaves")
+            params = dict(n_seeds=4, n_sub_seeds=3, max_depth=max_depth, sampling_method=method)
+            leaves = full.generate_seed_hierarchy(**params)[max_depth]
+            
+            # Fewer than one parent's children, a few parents' worth, and more than exist
+            for n in (2, 7, len(leaves) + 5):
+                assert lazy.generate_leaf_seeds(n, **params) == leaves[:n], (method, max_depth, n)
+            
+            # Leaves carry the same parent links as in the full hierarchy
+            for manager in (full, lazy):
+                for seed in leaves[:7]:
+                    manager.add_experiment_result(seed, "regression", {"rmse": 0.0}, method)
+            drop_time = lambda m: [{k: v for k, v in r.to_dict().items() if k != "timestamp"} for r in m.results]
+            assert drop_time(lazy) == drop_time(full)
+        
+        print(f"{method.capitalize():12} leaf seeds match at depths 1-3")
+    
+    print(f"\n✅ Leaf seed generation works!\n")
+
+
 def main():
     """Run all tests."""
+    import pytest
+    
     print("\n" + "=" * 70)
     print("SEEDHASH: 4 RANDOM SAMPLING TECHNIQUES - COMPREHENSIVE TEST")
     print("=" * 70)
@@ -201,6 +597,20 @@ def main():
     test_systematic_random_sampling()
     test_reproducibility()
     test_integration_with_experiment_manager()
+    test_spawn_seed_hierarchy()
+    test_bulk_experiment_results()
+    test_columnar_experiment_results()
+    test_export_multiple_formats()
+    test_results_cache()
+    test_hierarchy_disk_cache()
+    try:
+        test_semi_supervised_numba_matches_numpy()
+    except pytest.skip.Exception as e:
+        print(f"TEST 13 skipped: {e}\n")
+    test_multiclass_classification_metrics()
+    test_metric_dtype()
+    test_compact_dtypes()
+    test_generate_leaf_seeds()
     
     print("=" * 70)
     print("ALL TESTS PASSED! 🎉")
@@ -212,6 +622,17 @@ def main():
     print("✅ 4. Systematic Random Sampling - Working")
     print("✅ 5. Reproducibility - Verified")
     print("✅ 6. SeedExperimentManager Integration - Working")
+    print("✅ 7. SeedSequence Spawn Hierarchy - Working")
+    print("✅ 8. Bulk Experiment Results - Working")
+    print("✅ 9. Columnar Experiment Results - Working")
+    print("✅ 10. Multi-Format Export - Working")
+    print("✅ 11. Results Cache - Working")
+    print("✅ 12. Hierarchy Disk Cache - Working")
+    print("✅ 13. Numba Semi-Supervised Metrics - Working (if numba installed)")
+    print("✅ 14. Multi-Class Classification Metrics - Working")
+    print("✅ 15. Metric DType - Working")
+    print("✅ 16. Compact DTypes - Working")
+    print("✅ 17. Leaf Seeds - Working")
     print("\nAll 4 sampling techniques are fully functional!")
     print("=" * 70)
 
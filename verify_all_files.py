@@ -10,13 +10,24 @@ This script checks:
 
 import sys
 import os
+import re
 import json
-import importlib.util
-from pathlib import Path
 
 # Add Python directory to path
 sys.path.insert(0, 'Python')
 
+# Deprecated API patterns, each list compiled into one alternation so a file
+# is scanned once however many patterns there are
+DEPRECATED_EXAMPLE_PATTERNS = re.compile('|'.join(map(re.escape, [
+    'simple_random_sample(',
+    'stratified_random_sample(',
+])))
+DEPRECATED_NOTEBOOK_PATTERNS = re.compile('|'.join(map(re.escape, [
+    'manager.simple_random_sample(',
+    'manager.stratified_random_sample(',
+    'subdirectory=Python[all]',  # Wrong install syntax
+])))
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -214,7 +225,7 @@ def verify_python_examples():
                 content = f.read()
                 
                 # Check for deprecated methods
-                if 'simple_random_sample(' in content or 'stratified_random_sample(' in content:
+                if DEPRECATED_EXAMPLE_PATTERNS.search(content):
                     print_error(f"{file_path} uses deprecated method names")
                 else:
                     print_success(f"{os.path.basename(file_path)} - No deprecated methods")
@@ -265,12 +276,6 @@ def verify_notebooks():
         'jupyter/03_Advanced_ML_Paradigms.ipynb',
     ]
     
-    deprecated_patterns = [
-        'manager.simple_random_sample(',
-        'manager.stratified_random_sample(',
-        'subdirectory=Python[all]',  # Wrong install syntax
-    ]
-    
     correct_patterns = [
         'SeedSampler',
         'simple_random_sampling',
@@ -291,14 +296,13 @@ def verify_notebooks():
                     continue
                 
                 # Extract all code from cells (source only, not outputs)
-                all_code = ""
-                for cell in notebook['cells']:
-                    if cell['cell_type'] == 'code':
-                        # Only check the source, not the outputs
-                        all_code += ''.join(cell.get('source', []))
+                all_code = ''.join(
+                    ''.join(cell.get('source', []))
+                    for cell in notebook['cells'] if cell['cell_type'] == 'code'
+                )
                 
                 # Check for deprecated patterns
-                has_deprecated = any(pattern in all_code for pattern in deprecated_patterns)
+                has_deprecated = DEPRECATED_NOTEBOOK_PATTERNS.search(all_code) is not None
                 
                 if has_deprecated:
                     print_error(f"{os.path.basename(file_path)} - Contains deprecated API calls")